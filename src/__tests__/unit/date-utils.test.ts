@@ -0,0 +1,38 @@
+/**
+ * Tests for date utility functions
+ */
+
+import { describe, it, expect } from "vitest";
+import { getDayOfWeek } from "../../utils/date-utils.js";
+
+describe("Date Utils", () => {
+  describe("getDayOfWeek", () => {
+    it("should return 0 for Sunday through 6 for Saturday", () => {
+      expect(getDayOfWeek(2024, 7, 14)).toBe(0); // Sunday
+      expect(getDayOfWeek(2024, 7, 15)).toBe(1); // Monday
+      expect(getDayOfWeek(2024, 7, 20)).toBe(6); // Saturday
+    });
+
+    it("should handle January, February and leap days", () => {
+      expect(getDayOfWeek(1970, 1, 1)).toBe(4); // Thursday
+      expect(getDayOfWeek(2024, 2, 29)).toBe(4); // Thursday
+      expect(getDayOfWeek(2100, 3, 1)).toBe(1); // Monday
+    });
+
+    it("should agree with Date for every day of a year", () => {
+      const dayMs = 24 * 60 * 60 * 1000;
+      const end = Date.UTC(2025, 0, 1);
+
+      for (let time = Date.UTC(2024, 0, 1); time < end; time += dayMs) {
+        const date = new Date(time);
+        expect(
+          getDayOfWeek(
+            date.getUTCFullYear(),
+            date.getUTCMonth() + 1,
+            date.getUTCDate()
+          )
+        ).toBe(date.getUTCDay());
+      }
+    });
+  });
+});
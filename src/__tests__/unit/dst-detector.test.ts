@@ -3,7 +3,12 @@
  */
 
 import { describe, it, expect } from "vitest";
-import { isDST, isBST } from "../../dst-detector.js";
+import {
+  isDST,
+  isDSTBatch,
+  isDSTUnchecked,
+  isBST,
+} from "../../dst-detector.js";
 
 describe("DST Detection", () => {
   describe("isDST", () => {
@@ -71,6 +76,49 @@ describe("DST Detection", () => {
     });
   });
 
+  describe("isDSTBatch", () => {
+    it("should match isDST for every date", () => {
+      const dates = [
+        new Date("2023-12-31T23:59:59Z"), // Year boundary
+        new Date("2024-03-31T00:59:59Z"), // Just before BST starts
+        new Date("2024-03-31T01:00:00Z"), // BST starts
+        new Date("2024-07-15T12:00:00Z"),
+        new Date("2025-01-15T12:00:00Z"),
+      ];
+
+      for (const timezone of ["Europe/London", "Australia/Sydney"]) {
+        expect(isDSTBatch(dates, timezone)).toEqual(
+          dates.map((date) => isDST(date, timezone))
+        );
+      }
+    });
+
+    it("should return all false for timezones without DST", () => {
+      const dates = [new Date("2024-07-15T12:00:00Z")];
+      expect(isDSTBatch(dates, "Asia/Tokyo")).toEqual([false]);
+    });
+
+    it("should throw error if any date is invalid", () => {
+      expect(() =>
+        isDSTBatch([new Date("invalid")], "Europe/London")
+      ).toThrow("Invalid date: date is NaN");
+    });
+  });
+
+  describe("isDSTUnchecked", () => {
+    it("should match isDST for valid input", () => {
+      const summer = new Date("2024-07-15T12:00:00Z");
+      const winter = new Date("2024-01-15T12:00:00Z");
+
+      const timezones = ["Europe/London", "America/Chicago", "Asia/Tokyo"];
+
+      for (const timezone of timezones) {
+        expect(isDSTUnchecked(summer, timezone)).toBe(isDST(summer, timezone));
+        expect(isDSTUnchecked(winter, timezone)).toBe(isDST(winter, timezone));
+      }
+    });
+  });
+
   describe("isBST", () => {
     it("should be a convenience function for Europe/London DST detection", () => {
       const summerDate = new Date("2024-07-15T12:00:00Z");
@@ -66,6 +66,16 @@ describe("DST Transitions", () => {
       expect(transitions!.dstEndUtc.getUTCMonth()).toBe(9); // October
     });
 
+    it("should return independent Date objects on repeated calls", () => {
+      const first = dstTransitionDates(2024, "Europe/London")!;
+      const expectedStart = first.dstStartUtc.toISOString();
+      first.dstStartUtc.setUTCFullYear(2000);
+
+      const second = dstTransitionDates(2024, "Europe/London")!;
+      expect(second.dstStartUtc).not.toBe(first.dstStartUtc);
+      expect(second.dstStartUtc.toISOString()).toBe(expectedStart);
+    });
+
     it("should throw error for invalid years", () => {
       expect(() => dstTransitionDates(1969)).toThrow("Invalid year");
       expect(() => dstTransitionDates(2101)).toThrow("Invalid year");
@@ -0,0 +1,29 @@
+/**
+ * Tests for formatting utilities
+ */
+
+import { describe, it, expect } from "vitest";
+import { formatOffset } from "../../utils/formatting.js";
+
+describe("Formatting", () => {
+  describe("formatOffset", () => {
+    it("should format whole and partial hour offsets", () => {
+      expect(formatOffset(0)).toBe("GMT+00:00");
+      expect(formatOffset(60)).toBe("GMT+01:00");
+      expect(formatOffset(-300)).toBe("GMT-05:00");
+      expect(formatOffset(330)).toBe("GMT+05:30");
+      expect(formatOffset(345)).toBe("GMT+05:45");
+    });
+
+    it("should format the ends of the precomputed range", () => {
+      expect(formatOffset(-720)).toBe("GMT-12:00");
+      expect(formatOffset(840)).toBe("GMT+14:00");
+    });
+
+    it("should format offsets outside the precomputed range", () => {
+      expect(formatOffset(-750)).toBe("GMT-12:30");
+      expect(formatOffset(900)).toBe("GMT+15:00");
+      expect(formatOffset(61)).toBe("GMT+01:01");
+    });
+  });
+});
@@ -5,8 +5,12 @@
 import { describe, it, expect } from "vitest";
 import {
   toTimezoneParts,
+  toTimezonePartsBatch,
+  toTimezonePartsUnchecked,
   toLondonParts,
   fromTimezoneParts,
+  fromTimezonePartsBatch,
+  fromTimezonePartsUnchecked,
   fromLondonParts,
 } from "../../time-converter.js";
 
@@ -86,6 +90,20 @@ describe("Time Converter", () => {
           second: 0,
         });
       });
+
+      it("should roll over the local date across year end", () => {
+        const date = new Date("2024-12-31T20:30:45Z");
+        const parts = toTimezoneParts(date, "Asia/Tokyo");
+
+        expect(parts).toEqual({
+          year: 2025,
+          month: 1,
+          day: 1,
+          hour: 5,
+          minute: 30,
+          second: 45,
+        });
+      });
     });
 
     it("should default to Europe/London when no timezone specified", () => {
@@ -147,6 +165,44 @@ describe("Time Converter", () => {
     });
   });
 
+  describe("toTimezonePartsBatch", () => {
+    it("should match toTimezoneParts for every date", () => {
+      const dates = [
+        new Date("2024-01-15T12:00:00Z"),
+        new Date("2024-07-15T12:00:00Z"),
+        new Date("2024-07-15T23:00:00Z"), // London midnight BST
+      ];
+
+      // Europe/London reads the zone database, Asia/Tokyo is fixed-offset
+      for (const timezone of ["Europe/London", "Asia/Tokyo"]) {
+        const batch = toTimezonePartsBatch(dates, timezone);
+
+        dates.forEach((date, i) => {
+          expect({
+            year: batch.year[i],
+            month: batch.month[i],
+            day: batch.day[i],
+            hour: batch.hour[i],
+            minute: batch.minute[i],
+            second: batch.second[i],
+          }).toEqual(toTimezoneParts(date, timezone));
+        });
+      }
+    });
+
+    it("should return empty arrays for an empty batch", () => {
+      const batch = toTimezonePartsBatch([], "Asia/Tokyo");
+      expect(batch.year).toHaveLength(0);
+    });
+
+    it("should throw error if any date is invalid", () => {
+      const dates = [new Date("2024-07-15T12:00:00Z"), new Date("invalid")];
+      expect(() => toTimezonePartsBatch(dates, "Europe/London")).toThrow(
+        "Invalid date: date is NaN"
+      );
+    });
+  });
+
   describe("fromTimezoneParts", () => {
     describe("Normal cases", () => {
       it("should create UTC date from London BST parts", () => {
@@ -241,6 +297,23 @@ describe("Time Converter", () => {
 
         const result = fromTimezoneParts(gapParts, "Europe/London");
         expect(result).toBeInstanceOf(Date);
+        // Advanced past the one-hour gap to 02:30 BST
+        expect(result.toISOString()).toBe("2024-03-31T01:30:00.000Z");
+      });
+
+      it("should resolve ambiguous fall-back times to standard time", () => {
+        // 01:30 occurs twice in London on October 27, 2024 (BST, then GMT)
+        const ambiguousParts = {
+          year: 2024,
+          month: 10,
+          day: 27,
+          hour: 1,
+          minute: 30,
+          second: 0,
+        };
+
+        const result = fromTimezoneParts(ambiguousParts, "Europe/London");
+        expect(result.toISOString()).toBe("2024-10-27T01:30:00.000Z"); // 01:30 GMT
       });
     });
 
@@ -289,6 +362,69 @@ describe("Time Converter", () => {
     });
   });
 
+  describe("fromTimezonePartsBatch", () => {
+    it("should round-trip dates produced by toTimezonePartsBatch", () => {
+      const dates = [
+        new Date("2024-01-15T12:00:00Z"),
+        new Date("2024-07-15T12:00:00Z"),
+        new Date("2024-10-27T02:30:00Z"), // After London fall-back
+      ];
+
+      const parts = toTimezonePartsBatch(dates, "Europe/London");
+      const result = fromTimezonePartsBatch(parts, "Europe/London");
+
+      expect(result.map((date) => date.toISOString())).toEqual(
+        dates.map((date) => date.toISOString())
+      );
+    });
+
+    it("should match fromTimezoneParts for gap times", () => {
+      const parts = {
+        year: Uint16Array.of(2024),
+        month: Uint8Array.of(3),
+        day: Uint8Array.of(31),
+        hour: Uint8Array.of(1),
+        minute: Uint8Array.of(30),
+        second: Uint8Array.of(0),
+      };
+
+      const [result] = fromTimezonePartsBatch(parts, "Europe/London");
+      expect(result?.toISOString()).toBe(
+        fromTimezoneParts(
+          { year: 2024, month: 3, day: 31, hour: 1, minute: 30, second: 0 },
+          "Europe/London"
+        ).toISOString()
+      );
+    });
+
+    it("should throw error if any row is invalid", () => {
+      const parts = {
+        year: Uint16Array.of(2024, 2024),
+        month: Uint8Array.of(7, 13),
+        day: Uint8Array.of(15, 1),
+        hour: Uint8Array.of(12, 0),
+        minute: Uint8Array.of(0, 0),
+        second: Uint8Array.of(0, 0),
+      };
+
+      expect(() => fromTimezonePartsBatch(parts, "Europe/London")).toThrow();
+    });
+  });
+
+  describe("unchecked variants", () => {
+    it("should match the validating functions for valid input", () => {
+      const date = new Date("2024-07-15T12:34:56Z");
+      const parts = toTimezoneParts(date, "America/New_York");
+
+      expect(toTimezonePartsUnchecked(date, "America/New_York")).toEqual(
+        parts
+      );
+      expect(fromTimezonePartsUnchecked(parts, "America/New_York")).toEqual(
+        fromTimezoneParts(parts, "America/New_York")
+      );
+    });
+  });
+
   describe("fromLondonParts", () => {
     it("should be a convenience function for Europe/London parts conversion", () => {
       const bstParts = {
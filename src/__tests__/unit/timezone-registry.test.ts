@@ -7,6 +7,7 @@ import {
   getTimezoneMetadata,
   isSupportedTimezone,
   getSupportedTimezones,
+  clearRuntimeTimezoneCache,
   TIMEZONE_REGISTRY,
 } from "../../timezone-registry.js";
 import { validatePlatformTimezone } from "../../utils/validation.js";
@@ -32,6 +33,19 @@ describe("Timezone Registry", () => {
         "Unsupported timezone: Invalid/Timezone"
       );
     });
+
+    it("should return cached runtime metadata until the cache is cleared", () => {
+      const first = getTimezoneMetadata("Asia/Kolkata");
+      expect(getTimezoneMetadata("Asia/Kolkata")).toBe(first);
+
+      clearRuntimeTimezoneCache("Asia/Kolkata");
+
+      const regenerated = getTimezoneMetadata("Asia/Kolkata");
+      expect(regenerated).not.toBe(first);
+      expect(regenerated.standardOffset).toBe(first.standardOffset);
+
+      clearRuntimeTimezoneCache("Asia/Kolkata");
+    });
   });
 
   describe("isSupportedTimezone", () => {
@@ -45,6 +59,13 @@ describe("Timezone Registry", () => {
       expect(isSupportedTimezone("Invalid/Timezone")).toBe(false);
       expect(isSupportedTimezone("")).toBe(false);
     });
+
+    it("should not treat inherited object keys as timezones", () => {
+      expect(isSupportedTimezone("toString")).toBe(false);
+      expect(() => getTimezoneMetadata("constructor")).toThrow(
+        "Unsupported timezone: constructor"
+      );
+    });
   });
 
   describe("validatePlatformTimezone", () => {
@@ -58,6 +79,13 @@ describe("Timezone Registry", () => {
         "Timezone 'Invalid/Timezone' not available on this system"
       );
     });
+
+    it("should keep rejecting invalid timezones on repeated calls", () => {
+      expect(() => validatePlatformTimezone("Europe/London")).not.toThrow();
+      expect(() => validatePlatformTimezone("Europe/London")).not.toThrow();
+      expect(() => validatePlatformTimezone("Invalid/Timezone")).toThrow();
+      expect(() => validatePlatformTimezone("Invalid/Timezone")).toThrow();
+    });
   });
 
   describe("getSupportedTimezones", () => {
@@ -88,5 +116,12 @@ describe("Timezone Registry", () => {
       expect(tokyo.standardOffset).toBe(540);
       expect(tokyo.dstOffset).toBeUndefined();
     });
+
+    it("should freeze shared metadata entries", () => {
+      const london = TIMEZONE_REGISTRY["Europe/London"];
+      expect(Object.isFrozen(TIMEZONE_REGISTRY)).toBe(true);
+      expect(Object.isFrozen(london)).toBe(true);
+      expect(Object.isFrozen(london.preferredAbbreviations)).toBe(true);
+    });
   });
 });
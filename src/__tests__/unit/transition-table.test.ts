@@ -0,0 +1,44 @@
+/**
+ * Tests for the precomputed offset transition table
+ */
+
+import { describe, it, expect } from "vitest";
+import { getOffsetAt } from "../../utils/transition-table.js";
+
+const offsetAt = (iso: string, timezone: string): number =>
+  getOffsetAt(Date.parse(iso), timezone);
+
+describe("Transition Table", () => {
+  describe("getOffsetAt", () => {
+    it("should return standard and DST offsets for Europe/London", () => {
+      expect(offsetAt("2024-01-15T12:00:00Z", "Europe/London")).toBe(0);
+      expect(offsetAt("2024-07-15T12:00:00Z", "Europe/London")).toBe(60);
+    });
+
+    it("should switch offset exactly at the transition instant", () => {
+      // BST starts 2024-03-31T01:00:00Z and ends 2024-10-27T01:00:00Z
+      expect(offsetAt("2024-03-31T00:59:59Z", "Europe/London")).toBe(0);
+      expect(offsetAt("2024-03-31T01:00:00Z", "Europe/London")).toBe(60);
+      expect(offsetAt("2024-10-27T00:59:59Z", "Europe/London")).toBe(60);
+      expect(offsetAt("2024-10-27T01:00:00Z", "Europe/London")).toBe(0);
+    });
+
+    it("should handle southern hemisphere DST", () => {
+      expect(offsetAt("2024-01-15T12:00:00Z", "Australia/Sydney")).toBe(660);
+      expect(offsetAt("2024-07-15T12:00:00Z", "Australia/Sydney")).toBe(600);
+    });
+
+    it("should stay correct when consecutive lookups leave the last segment", () => {
+      expect(offsetAt("2024-07-15T12:00:00Z", "Europe/London")).toBe(60);
+      expect(offsetAt("2024-07-16T12:00:00Z", "Europe/London")).toBe(60);
+      expect(offsetAt("2023-01-15T12:00:00Z", "Europe/London")).toBe(0);
+      expect(offsetAt("2024-12-31T23:59:59Z", "Europe/London")).toBe(0);
+      expect(offsetAt("2025-07-15T12:00:00Z", "Europe/London")).toBe(60);
+      expect(offsetAt("2024-03-31T00:59:59Z", "Europe/London")).toBe(0);
+    });
+
+    it("should return the fixed offset for timezones without DST", () => {
+      expect(offsetAt("2024-07-15T12:00:00Z", "Asia/Tokyo")).toBe(540);
+    });
+  });
+});
@@ -3,7 +3,7 @@
  */
 
 import { describe, it, expect } from "vitest";
-import { toUTCString } from "../../utc-formatter.js";
+import { toUTCString, toUTCStringBatch } from "../../utc-formatter.js";
 
 describe("UTC Formatter", () => {
   describe("toUTCString", () => {
@@ -119,4 +119,24 @@ describe("UTC Formatter", () => {
       expect(result1).toBe(result2);
     });
   });
+
+  describe("toUTCStringBatch", () => {
+    it("should format every date like toUTCString", () => {
+      const dates = [
+        new Date("2024-07-15T14:35:42.123Z"),
+        new Date("2024-01-05T08:05:05.007Z"),
+      ];
+
+      expect(toUTCStringBatch(dates)).toEqual([
+        "2024-07-15 14:35:42.123000Z",
+        "2024-01-05 08:05:05.007000Z",
+      ]);
+    });
+
+    it("should throw error if any date is invalid", () => {
+      expect(() => toUTCStringBatch([new Date("invalid")])).toThrow(
+        "Invalid date: date is NaN"
+      );
+    });
+  });
 });
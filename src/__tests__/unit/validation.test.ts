@@ -8,8 +8,11 @@ import {
   validateTimeParts,
   validateTimezone,
   validateTimeString,
+  parseTimeString,
+  validateWorkingHours,
   validateYear,
   validateWorkingDays,
+  getWorkingDayMask,
 } from "../../validator.js";
 
 describe("Validator", () => {
@@ -38,6 +41,16 @@ describe("Validator", () => {
         "Date outside supported range"
       );
     });
+
+    it("should apply the supported range in UTC", () => {
+      const first = new Date("1970-01-01T00:00:00.000Z");
+      const last = new Date("2100-12-31T23:59:59.999Z");
+      expect(() => validateDate(first)).not.toThrow();
+      expect(() => validateDate(last)).not.toThrow();
+      expect(() => validateDate(new Date(first.getTime() - 1))).toThrow(
+        "Date outside supported range"
+      );
+    });
   });
 
   describe("validateTimeParts", () => {
@@ -155,6 +168,39 @@ describe("Validator", () => {
     });
   });
 
+  describe("parseTimeString", () => {
+    it("should return minutes since midnight", () => {
+      expect(parseTimeString("00:00")).toBe(0);
+      expect(parseTimeString("09:00")).toBe(540);
+      expect(parseTimeString("17:30")).toBe(1050);
+      expect(parseTimeString("23:59")).toBe(1439);
+    });
+
+    it("should keep rejecting invalid strings on repeated calls", () => {
+      expect(() => parseTimeString("25:00")).toThrow("Invalid time format");
+      expect(() => parseTimeString("25:00")).toThrow("Invalid time format");
+      expect(() => parseTimeString(123 as any)).toThrow(
+        "Invalid time: expected string"
+      );
+    });
+  });
+
+  describe("validateWorkingHours", () => {
+    it("should return start and end in minutes since midnight", () => {
+      expect(validateWorkingHours("09:00", "17:30")).toEqual([540, 1050]);
+      expect(validateWorkingHours("22:00", "06:00")).toEqual([1320, 360]);
+    });
+
+    it("should reject invalid start or end times", () => {
+      expect(() => validateWorkingHours("9:00", "17:30")).toThrow(
+        "Invalid time format: 9:00"
+      );
+      expect(() => validateWorkingHours("09:00", "24:00")).toThrow(
+        "Invalid time format: 24:00"
+      );
+    });
+  });
+
   describe("validateYear", () => {
     it("should accept valid years", () => {
       expect(() => validateYear(2024)).not.toThrow();
@@ -195,4 +241,18 @@ describe("Validator", () => {
       );
     });
   });
+
+  describe("getWorkingDayMask", () => {
+    it("should set one bit per working day", () => {
+      expect(getWorkingDayMask([1, 2, 3, 4, 5])).toBe(0b0111110);
+      expect(getWorkingDayMask([0, 6])).toBe(0b1000001);
+      expect(getWorkingDayMask([])).toBe(0);
+    });
+
+    it("should report out-of-range days before duplicates", () => {
+      expect(() => getWorkingDayMask([1, 1, 7])).toThrow(
+        "Invalid working day: 7"
+      );
+    });
+  });
 });
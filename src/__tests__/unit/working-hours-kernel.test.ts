@@ -0,0 +1,79 @@
+/**
+ * Tests for the batch working hours kernels
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  workingHoursKernel,
+  workingDayKernel,
+} from "../../utils/working-hours-kernel.js";
+
+const localTimes = (...isos: string[]): Float64Array =>
+  Float64Array.from(isos, (iso) => Date.parse(iso));
+
+describe("Working Hours Kernel", () => {
+  describe("workingHoursKernel", () => {
+    it("should flag times within same-day hours inclusively", () => {
+      const times = localTimes(
+        "2024-07-15T08:59:00Z",
+        "2024-07-15T09:00:00Z",
+        "2024-07-15T17:30:59Z",
+        "2024-07-15T17:31:00Z"
+      );
+      const out = new Uint8Array(times.length);
+
+      workingHoursKernel(times, 540, 1050, out);
+      expect(Array.from(out)).toEqual([0, 1, 1, 0]);
+    });
+
+    it("should flag times within midnight-spanning hours", () => {
+      const times = localTimes(
+        "2024-07-15T21:59:00Z",
+        "2024-07-15T23:00:00Z",
+        "2024-07-16T06:00:00Z",
+        "2024-07-16T06:01:00Z"
+      );
+      const out = new Uint8Array(times.length);
+
+      workingHoursKernel(times, 1320, 360, out);
+      expect(Array.from(out)).toEqual([0, 1, 1, 0]);
+    });
+
+    it("should handle local times before the epoch", () => {
+      const times = localTimes(
+        "1969-12-31T19:00:00Z",
+        "1969-12-31T23:30:00Z"
+      );
+      const out = new Uint8Array(times.length);
+
+      workingHoursKernel(times, 1320, 360, out);
+      expect(Array.from(out)).toEqual([0, 1]);
+    });
+  });
+
+  describe("workingDayKernel", () => {
+    it("should look up the day of week with 0=Sunday", () => {
+      const times = localTimes(
+        "1970-01-01T00:00:00Z", // Thursday
+        "2024-07-20T00:00:00Z", // Saturday
+        "2024-07-21T23:59:59Z" // Sunday
+      );
+      const out = new Uint8Array(times.length);
+      const weekendOnly = (1 << 0) | (1 << 6);
+
+      workingDayKernel(times, weekendOnly, out);
+      expect(Array.from(out)).toEqual([0, 1, 1]);
+    });
+
+    it("should handle local times before the epoch", () => {
+      const times = localTimes(
+        "1969-12-31T19:00:00Z", // Wednesday
+        "1969-12-27T12:00:00Z" // Saturday
+      );
+      const out = new Uint8Array(times.length);
+
+      workingDayKernel(times, 1 << 3, out);
+      expect(Array.from(out)).toEqual([1, 0]);
+    });
+  });
+});
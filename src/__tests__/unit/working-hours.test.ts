@@ -5,8 +5,11 @@
 import { describe, it, expect } from "vitest";
 import {
   inWorkingHours,
+  inWorkingHoursBatch,
   inWorkingHoursLondon,
   isWorkingDay,
+  isWorkingDayBatch,
+  isWorkingMoment,
 } from "../../working-hours.js";
 
 describe("Working Hours", () => {
@@ -118,6 +121,52 @@ describe("Working Hours", () => {
     });
   });
 
+  describe("inWorkingHours configuration reuse", () => {
+    it("should give the same answers on repeated calls", () => {
+      const date = new Date("2024-07-15T13:00:00Z"); // 14:00 BST
+
+      for (let i = 0; i < 3; i++) {
+        expect(inWorkingHours(date, "Europe/London", "08:00", "16:00")).toBe(
+          true
+        );
+        expect(inWorkingHours(date, "Europe/London", "15:00", "16:00")).toBe(
+          false
+        );
+      }
+    });
+
+    it("should keep validating inputs after a configuration is cached", () => {
+      const date = new Date("2024-07-15T13:00:00Z");
+      inWorkingHours(date, "Europe/London", "08:00", "16:00");
+
+      expect(() =>
+        inWorkingHours(date, "Invalid/Timezone", "08:00", "16:00")
+      ).toThrow("Timezone 'Invalid/Timezone' not available on this system");
+      expect(() =>
+        inWorkingHours(date, "Europe/London", ["08:00"] as any, "16:00")
+      ).toThrow("Invalid time: expected string");
+    });
+
+    it("should report invalid hours before an invalid timezone", () => {
+      const date = new Date("2024-07-15T13:00:00Z");
+
+      expect(() =>
+        inWorkingHours(date, "Invalid/Timezone", "25:00", "16:00")
+      ).toThrow("Invalid time format: 25:00");
+    });
+
+    it("should stay correct past the configuration cache limit", () => {
+      const date = new Date("2024-07-15T13:00:00Z"); // 14:00 BST
+
+      for (let minutes = 0; minutes < 1200; minutes++) {
+        const start = `${String(Math.floor(minutes / 60)).padStart(2, "0")}:${String(minutes % 60).padStart(2, "0")}`;
+        expect(inWorkingHours(date, "Europe/London", start, "23:59")).toBe(
+          minutes <= 840
+        );
+      }
+    });
+  });
+
   describe("inWorkingHoursLondon", () => {
     it("should be a convenience function for Europe/London working hours", () => {
       const workingTime = new Date("2024-07-15T13:00:00Z"); // 14:00 BST
@@ -141,6 +190,35 @@ describe("Working Hours", () => {
       expect(inWorkingHoursLondon(earlyTime)).toBe(false); // Default hours
       expect(inWorkingHoursLondon(earlyTime, "07:00", "15:00")).toBe(true); // Custom hours
     });
+
+    it("should match inWorkingHours across GMT and BST boundaries", () => {
+      const dates = [
+        new Date("2024-03-31T00:59:59Z"), // 00:59 GMT
+        new Date("2024-03-31T01:00:00Z"), // 02:00 BST
+        new Date("2024-10-27T08:59:00Z"), // 08:59 GMT
+        new Date("2024-10-27T09:00:00Z"), // 09:00 GMT
+        new Date("2024-07-15T16:30:59Z"), // 17:30 BST
+        new Date("2024-07-15T23:00:00Z"), // 00:00 BST
+      ];
+
+      for (const date of dates) {
+        expect(inWorkingHoursLondon(date)).toBe(
+          inWorkingHours(date, "Europe/London")
+        );
+        expect(inWorkingHoursLondon(date, "22:00", "02:00")).toBe(
+          inWorkingHours(date, "Europe/London", "22:00", "02:00")
+        );
+      }
+    });
+
+    it("should throw error for invalid inputs", () => {
+      expect(() => inWorkingHoursLondon(new Date("invalid"))).toThrow(
+        "Invalid date: date is NaN"
+      );
+      expect(() =>
+        inWorkingHoursLondon(new Date("2024-07-15T12:00:00Z"), "9:00")
+      ).toThrow("Invalid time format");
+    });
   });
 
   describe("isWorkingDay", () => {
@@ -225,4 +303,106 @@ describe("Working Hours", () => {
       );
     });
   });
+
+  describe("inWorkingHoursBatch", () => {
+    const dates = [
+      new Date("2024-07-15T07:59:00Z"), // 08:59 BST
+      new Date("2024-07-15T08:00:00Z"), // 09:00 BST
+      new Date("2024-07-15T16:30:00Z"), // 17:30 BST
+      new Date("2024-07-15T16:31:00Z"), // 17:31 BST
+      new Date("2024-01-15T09:00:00Z"), // 09:00 GMT
+      new Date("2024-07-15T23:00:00Z"), // 00:00 BST
+    ];
+
+    it("should match inWorkingHours for every date", () => {
+      for (const timezone of ["Europe/London", "America/Chicago"]) {
+        expect(inWorkingHoursBatch(dates, timezone)).toEqual(
+          dates.map((date) => inWorkingHours(date, timezone))
+        );
+        expect(inWorkingHoursBatch(dates, timezone, "22:00", "06:00")).toEqual(
+          dates.map((date) => inWorkingHours(date, timezone, "22:00", "06:00"))
+        );
+      }
+    });
+
+    it("should handle local times before the epoch", () => {
+      // 1970-01-01T00:00Z is 19:00 on 1969-12-31 in New York
+      const epoch = [new Date("1970-01-01T00:00:00Z")];
+      expect(
+        inWorkingHoursBatch(epoch, "America/New_York", "22:00", "06:00")
+      ).toEqual([false]);
+      expect(
+        inWorkingHoursBatch(epoch, "America/New_York", "18:00", "20:00")
+      ).toEqual([true]);
+    });
+
+    it("should throw error if any date is invalid", () => {
+      expect(() =>
+        inWorkingHoursBatch([dates[0]!, new Date("invalid")], "Europe/London")
+      ).toThrow("Invalid date: date is NaN");
+    });
+  });
+
+  describe("isWorkingDayBatch", () => {
+    it("should match isWorkingDay for every date", () => {
+      const dates = [
+        new Date("2024-07-15T12:00:00Z"), // Monday
+        new Date("2024-07-19T23:00:00Z"), // Saturday 00:00 BST
+        new Date("2024-07-20T12:00:00Z"), // Saturday
+        new Date("2024-07-21T12:00:00Z"), // Sunday
+      ];
+
+      for (const workingDays of [[1, 2, 3, 4, 5], [0, 6], []]) {
+        expect(isWorkingDayBatch(dates, "Europe/London", workingDays)).toEqual(
+          dates.map((date) => isWorkingDay(date, "Europe/London", workingDays))
+        );
+      }
+    });
+
+    it("should throw error for invalid working days", () => {
+      expect(() => isWorkingDayBatch([], "Europe/London", [7])).toThrow(
+        "Invalid working day: 7"
+      );
+    });
+  });
+
+  describe("isWorkingMoment", () => {
+    it("should require both a working day and working hours", () => {
+      const mondayAfternoon = new Date("2024-07-15T13:00:00Z"); // Mon 14:00 BST
+      const mondayEvening = new Date("2024-07-15T19:00:00Z"); // Mon 20:00 BST
+      const saturdayAfternoon = new Date("2024-07-20T13:00:00Z"); // Sat 14:00 BST
+
+      expect(isWorkingMoment(mondayAfternoon, "Europe/London")).toBe(true);
+      expect(isWorkingMoment(mondayEvening, "Europe/London")).toBe(false);
+      expect(isWorkingMoment(saturdayAfternoon, "Europe/London")).toBe(false);
+    });
+
+    it("should match isWorkingDay && inWorkingHours", () => {
+      const dates = [
+        new Date("2024-07-19T23:30:00Z"), // Sat 00:30 BST
+        new Date("2024-07-21T22:30:00Z"), // Sun 23:30 BST
+        new Date("2024-07-22T04:00:00Z"), // Mon 05:00 BST
+      ];
+      const weekendOnly = [0, 6];
+
+      for (const date of dates) {
+        expect(
+          isWorkingMoment(date, "Europe/London", "22:00", "06:00", weekendOnly)
+        ).toBe(
+          isWorkingDay(date, "Europe/London", weekendOnly) &&
+            inWorkingHours(date, "Europe/London", "22:00", "06:00")
+        );
+      }
+    });
+
+    it("should throw error for invalid inputs", () => {
+      const date = new Date("2024-07-15T13:00:00Z");
+      expect(() => isWorkingMoment(new Date("invalid"))).toThrow(
+        "Invalid date: date is NaN"
+      );
+      expect(() =>
+        isWorkingMoment(date, "Europe/London", "09:00", "17:30", [7])
+      ).toThrow("Invalid working day: 7");
+    });
+  });
 });
@@ -0,0 +1,79 @@
+/**
+ * Tests for the per-timezone formatter cache
+ */
+
+import { describe, it, expect, vi } from "vitest";
+import {
+  getPartsFormatter,
+  getZoneNameFormatter,
+  clearZoneCache,
+  onZoneCacheClear,
+  MAX_CACHED_ZONES,
+} from "../../utils/zone-cache.js";
+
+describe("Zone Cache", () => {
+  describe("getPartsFormatter", () => {
+    it("should reuse the same formatter for a timezone", () => {
+      const first = getPartsFormatter("Europe/London");
+      const second = getPartsFormatter("Europe/London");
+      expect(second).toBe(first);
+      expect(getPartsFormatter("Asia/Tokyo")).not.toBe(first);
+    });
+
+    it("should report midnight as hour 00", () => {
+      const parts = getPartsFormatter("Europe/London").formatToParts(
+        new Date("2024-07-15T23:00:00Z") // 00:00 BST
+      );
+      expect(parts.find((p) => p.type === "hour")?.value).toBe("00");
+    });
+
+    it("should evict the least recently used formatter once full", () => {
+      const first = getPartsFormatter("Europe/Paris");
+
+      // Case variants of one zone are distinct keys the platform accepts
+      for (let i = 0; i < MAX_CACHED_ZONES; i++) {
+        const variant = Array.from("europe/london", (char, j) =>
+          j < 6 && (i >> j) & 1 ? char.toUpperCase() : char
+        ).join("");
+        getPartsFormatter(variant);
+      }
+
+      expect(getPartsFormatter("Europe/Paris")).not.toBe(first);
+    });
+
+    it("should throw for timezones unavailable on the platform", () => {
+      expect(() => getPartsFormatter("Invalid/Timezone")).toThrow();
+    });
+  });
+
+  describe("getZoneNameFormatter", () => {
+    it("should reuse the same formatter for a timezone", () => {
+      const first = getZoneNameFormatter("America/New_York");
+      expect(getZoneNameFormatter("America/New_York")).toBe(first);
+    });
+  });
+
+  describe("clearZoneCache", () => {
+    it("should drop cached formatters", () => {
+      const parts = getPartsFormatter("Europe/Paris");
+      const zoneName = getZoneNameFormatter("Europe/Paris");
+
+      clearZoneCache();
+
+      expect(getPartsFormatter("Europe/Paris")).not.toBe(parts);
+      expect(getZoneNameFormatter("Europe/Paris")).not.toBe(zoneName);
+    });
+
+    it("should run registered resets for derived caches", () => {
+      const reset = vi.fn();
+      const unregister = onZoneCacheClear(reset);
+
+      clearZoneCache();
+      expect(reset).toHaveBeenCalledTimes(1);
+
+      unregister();
+      clearZoneCache();
+      expect(reset).toHaveBeenCalledTimes(1);
+    });
+  });
+});
@@ -2,16 +2,22 @@
  * Platform-based DST detection using Intl APIs
  *
  * This module uses the platform's timezone database via Intl.DateTimeFormat
- * to detect DST status, ensuring always-current DST rules.
+ * to detect DST status, ensuring always-current DST rules. Registry timezones
+ * probe the database once per year and answer from a precomputed table.
  */
 
-import { getTimezoneMetadata } from "./timezone-registry.js";
+import {
+  getTimezoneMetadata,
+  isHardcodedTimezone,
+} from "./timezone-registry.js";
 import {
   validateDate,
   validateTimezone,
   validatePlatformTimezone,
 } from "./utils/validation.js";
 import { getTimezoneOffset } from "./utils/date-utils.js";
+import { getZoneNameFormatter } from "./utils/zone-cache.js";
+import { getOffsetAt, lookupOffsets } from "./utils/transition-table.js";
 import { timezoneDetector } from "./timezone-detector.js";
 
 /**
@@ -54,31 +60,115 @@ export function isDST(date: Date, timezone?: string): boolean {
   validateTimezone(effectiveTimezone);
 
   const metadata = getTimezoneMetadata(effectiveTimezone);
+
+  // If timezone doesn't have DST, it's never in DST; the answer comes from the
+  // metadata alone, so skip the platform lookup entirely
+  if (!metadata.dstOffset) {
+    return false;
+  }
+
   validatePlatformTimezone(effectiveTimezone);
 
-  // If timezone doesn't have DST, it's never in DST
+  return isDSTUnchecked(date, effectiveTimezone);
+}
+
+/**
+ * Check if a date is in Daylight Saving Time without validating the inputs
+ *
+ * For callers that have already validated the date and the timezone (for
+ * example once per batch). Passing an invalid date or an identifier the
+ * platform does not support gives undefined results.
+ *
+ * @param date - A valid date within the supported range
+ * @param timezone - A supported IANA timezone identifier
+ * @returns `true` if the date is in DST for the timezone
+ */
+export function isDSTUnchecked(date: Date, timezone: string): boolean {
+  const metadata = getTimezoneMetadata(timezone);
   if (!metadata.dstOffset) {
     return false;
   }
 
-  // Use Intl.DateTimeFormat to get timezone information
-  const formatter = new Intl.DateTimeFormat("en", {
-    timeZone: effectiveTimezone,
-    timeZoneName: "short",
-  });
+  // Registry timezones resolve the offset from the precomputed transition table
+  if (isHardcodedTimezone(timezone)) {
+    return getOffsetAt(date.getTime(), timezone) === metadata.dstOffset;
+  }
 
-  const parts = formatter.formatToParts(date);
+  // Use the cached Intl.DateTimeFormat to get timezone information
+  const parts = getZoneNameFormatter(timezone).formatToParts(date);
   const timeZoneName = parts.find(
     (part) => part.type === "timeZoneName"
   )?.value;
 
   if (!timeZoneName) {
     // Fallback: compare offset with expected DST offset
-    return isDSTByOffset(date, effectiveTimezone);
+    return isDSTByOffset(date, timezone);
   }
 
   // Check if the timezone name indicates DST
-  return isDSTAbbreviation(timeZoneName, effectiveTimezone, date);
+  return isDSTAbbreviation(timeZoneName, timezone, date);
+}
+
+/**
+ * Check many dates for Daylight Saving Time in a single timezone
+ *
+ * Batch counterpart of isDST. The timezone is resolved and validated once, and
+ * for registry timezones every date is answered from the precomputed offset
+ * transition table in one pass.
+ *
+ * @param dates - The dates to check (each must be a valid Date object)
+ * @param timezone - IANA timezone identifier (optional, auto-detects if omitted)
+ * @returns DST flags, index-aligned with `dates`
+ *
+ * @throws {Error} If any date is invalid (NaN) or outside supported range (1970-2100)
+ * @throws {Error} If timezone is not supported or unavailable on platform
+ * @throws {TimezoneDetectionError} If timezone detection fails and fallback is invalid
+ *
+ * @example
+ * ```typescript
+ * const dates = [
+ *   new Date('2024-01-15T12:00:00Z'),
+ *   new Date('2024-07-15T12:00:00Z'),
+ * ];
+ * console.log(isDSTBatch(dates, 'Europe/London'));  // [false, true]
+ * ```
+ */
+export function isDSTBatch(
+  dates: readonly Date[],
+  timezone?: string
+): boolean[] {
+  // Use auto-detection if no timezone provided
+  const effectiveTimezone = timezone ?? timezoneDetector.getDetectedTimezone();
+  validateTimezone(effectiveTimezone);
+
+  const metadata = getTimezoneMetadata(effectiveTimezone);
+
+  const times = new Float64Array(dates.length);
+  for (let i = 0; i < dates.length; i++) {
+    const date = dates[i]!;
+    validateDate(date);
+    times[i] = date.getTime();
+  }
+
+  // If timezone doesn't have DST, no date is in DST
+  const dstOffset = metadata.dstOffset;
+  if (!dstOffset) {
+    return new Array<boolean>(dates.length).fill(false);
+  }
+
+  validatePlatformTimezone(effectiveTimezone);
+
+  // Runtime timezones have no precomputed table; check dates individually
+  if (!isHardcodedTimezone(effectiveTimezone)) {
+    return dates.map((date) => isDSTUnchecked(date, effectiveTimezone));
+  }
+
+  const offsets = lookupOffsets(times, effectiveTimezone);
+  const result = new Array<boolean>(dates.length);
+  for (let i = 0; i < offsets.length; i++) {
+    result[i] = offsets[i] === dstOffset;
+  }
+  return result;
 }
 
 /**
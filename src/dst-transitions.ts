@@ -15,8 +15,18 @@ import {
   validatePlatformTimezone,
 } from "./utils/validation.js";
 import { isDST } from "./dst-detector.js";
+import { onZoneCacheClear } from "./utils/zone-cache.js";
 import { DEFAULT_TIMEZONE } from "./constants.js";
 
+/**
+ * Memoized transition instants per "timezone:year", or null for years without
+ * a complete DST period. Epoch milliseconds are stored rather than Dates so
+ * callers can never mutate a shared instance.
+ */
+const transitionMemo = new Map<string, { start: number; end: number } | null>();
+
+onZoneCacheClear(() => transitionMemo.clear());
+
 /**
  * Get DST transition dates for a given year and timezone
  *
@@ -178,13 +188,39 @@ export function nextClockChange(from?: Date): NextChange | null {
   };
 }
 
+/**
+ * Find DST transitions for a given year and timezone, memoized per year
+ * @param year - The year to search
+ * @param timezone - The timezone identifier
+ * @returns Fresh DST start and end dates, or null if no transitions found
+ */
+function findDSTTransitions(
+  year: number,
+  timezone: string
+): { start: Date; end: Date } | null {
+  const key = `${timezone}:${year}`;
+  let cached = transitionMemo.get(key);
+
+  if (cached === undefined) {
+    const transitions = scanDSTTransitions(year, timezone);
+    cached = transitions
+      ? { start: transitions.start.getTime(), end: transitions.end.getTime() }
+      : null;
+    transitionMemo.set(key, cached);
+  }
+
+  return cached
+    ? { start: new Date(cached.start), end: new Date(cached.end) }
+    : null;
+}
+
 /**
  * Find DST transitions for a given year and timezone using platform APIs
  * @param year - The year to search
  * @param timezone - The timezone identifier
  * @returns DST start and end dates, or null if no transitions found
  */
-function findDSTTransitions(
+function scanDSTTransitions(
   year: number,
   timezone: string
 ): { start: Date; end: Date } | null {
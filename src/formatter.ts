@@ -2,15 +2,42 @@
  * Time formatting utilities for timezone-aware string output
  */
 
-import { getTimezoneMetadata } from "./timezone-registry.js";
+import type { TimezoneMetadata } from "./types.js";
+import {
+  getTimezoneMetadata,
+  TIMEZONE_REGISTRY,
+} from "./timezone-registry.js";
 import {
   validateDate,
   validateTimezone,
   validatePlatformTimezone,
 } from "./utils/validation.js";
 import { formatOffset } from "./utils/formatting.js";
-import { isDST } from "./dst-detector.js";
 import { timezoneDetector } from "./timezone-detector.js";
+import { getLocalTimeParts } from "./utils/date-utils.js";
+
+/**
+ * Zero-padded strings for clock and calendar fields 0-59, so formatting needs
+ * no per-field pad() call (years in the supported range are always 4 digits)
+ */
+const TWO_DIGITS = Array.from({ length: 60 }, (_, i) =>
+  i < 10 ? `0${i}` : `${i}`
+);
+
+/**
+ * Resolved [standard, DST] abbreviations per timezone metadata object
+ *
+ * Each timezone only ever formats with one of two labels, so they are resolved
+ * once: eagerly for the hardcoded registry, on first use for runtime zones.
+ */
+const abbreviationCache = new WeakMap<
+  TimezoneMetadata,
+  readonly [string, string]
+>();
+
+for (const metadata of Object.values(TIMEZONE_REGISTRY)) {
+  abbreviationCache.set(metadata, resolveAbbreviations(metadata));
+}
 
 /**
  * Format a Date as a timezone-aware string in "YYYY-MM-DD HH:mm:ss TZ" format
@@ -57,36 +84,23 @@ export function toTimezoneString(date: Date, timezone?: string): string {
 
   validatePlatformTimezone(effectiveTimezone);
 
-  // Get timezone-local time components
-  const formatter = new Intl.DateTimeFormat("en-CA", {
-    timeZone: effectiveTimezone,
-    year: "numeric",
-    month: "2-digit",
-    day: "2-digit",
-    hour: "2-digit",
-    minute: "2-digit",
-    second: "2-digit",
-    hour12: false,
-  });
-
-  const parts = formatter.formatToParts(date);
-  const year = parts.find((p) => p.type === "year")?.value ?? "0000";
-  const month = parts.find((p) => p.type === "month")?.value ?? "00";
-  const day = parts.find((p) => p.type === "day")?.value ?? "00";
-  let hour = parts.find((p) => p.type === "hour")?.value ?? "00";
-  const minute = parts.find((p) => p.type === "minute")?.value ?? "00";
-  const second = parts.find((p) => p.type === "second")?.value ?? "00";
-
-  // Handle the case where Intl.DateTimeFormat returns "24:00:00" for midnight
-  // Some locales/environments return "24:00:00" instead of "00:00:00"
-  if (hour === "24") {
-    hour = "00";
-  }
+  const metadata = getTimezoneMetadata(effectiveTimezone);
+
+  // Get timezone-local time components (shared with toTimezoneParts)
+  const { year, month, day, hour, minute, second } = getLocalTimeParts(
+    date,
+    effectiveTimezone
+  );
+
+  // Derive DST status from the same local parts rather than a second lookup
+  const localTime = Date.UTC(year, month - 1, day, hour, minute, second);
+  const offsetMinutes = Math.round((localTime - date.getTime()) / 60000);
+  const inDST = !!metadata.dstOffset && offsetMinutes === metadata.dstOffset;
 
   // Determine timezone abbreviation
-  const tzAbbreviation = getTimezoneAbbreviation(date, effectiveTimezone);
+  const tzAbbreviation = getTimezoneAbbreviationFor(metadata, inDST);
 
-  return `${year}-${month}-${day} ${hour}:${minute}:${second} ${tzAbbreviation}`;
+  return `${year}-${TWO_DIGITS[month]}-${TWO_DIGITS[day]} ${TWO_DIGITS[hour]}:${TWO_DIGITS[minute]}:${TWO_DIGITS[second]} ${tzAbbreviation}`;
 }
 
 /**
@@ -100,33 +114,42 @@ export function toLondonString(date: Date): string {
 }
 
 /**
- * Get the appropriate timezone abbreviation for a date and timezone
- * @param date - The date to check
- * @param timezone - The timezone identifier
+ * Get the appropriate timezone abbreviation for a known DST status
+ * @param metadata - The timezone metadata
+ * @param inDST - Whether the instant being formatted is in DST
  * @returns Timezone abbreviation (preferred) or offset format (fallback)
  */
-function getTimezoneAbbreviation(date: Date, timezone: string): string {
-  const metadata = getTimezoneMetadata(timezone);
+function getTimezoneAbbreviationFor(
+  metadata: TimezoneMetadata,
+  inDST: boolean
+): string {
+  let abbreviations = abbreviationCache.get(metadata);
+  if (!abbreviations) {
+    abbreviations = resolveAbbreviations(metadata);
+    abbreviationCache.set(metadata, abbreviations);
+  }
+
+  return inDST ? abbreviations[1] : abbreviations[0];
+}
+
+/**
+ * Resolve the standard and DST abbreviations for a timezone
+ * @param metadata - The timezone metadata
+ * @returns Preferred abbreviations, or offset format where none is preferred
+ */
+function resolveAbbreviations(
+  metadata: TimezoneMetadata
+): readonly [string, string] {
+  const standard =
+    metadata.preferredAbbreviations?.standard ??
+    formatOffset(metadata.standardOffset);
 
-  // For timezones without DST, use standard abbreviation or offset
   if (!metadata.dstOffset) {
-    return (
-      metadata.preferredAbbreviations?.standard ??
-      formatOffset(metadata.standardOffset)
-    );
+    return [standard, standard];
   }
 
-  // Check if currently in DST
-  const inDST = isDST(date, timezone);
-
-  if (inDST) {
-    return (
-      metadata.preferredAbbreviations?.dst ?? formatOffset(metadata.dstOffset)
-    );
-  } else {
-    return (
-      metadata.preferredAbbreviations?.standard ??
-      formatOffset(metadata.standardOffset)
-    );
-  }
+  return [
+    standard,
+    metadata.preferredAbbreviations?.dst ?? formatOffset(metadata.dstOffset),
+  ];
 }
@@ -8,6 +8,7 @@
 // Export all types
 export type {
   TimeParts,
+  TimePartsArray,
   TimezoneMetadata,
   DstTransitions,
   NextTransition,
@@ -37,8 +38,16 @@ export {
 // Export validation utilities
 export { validatePlatformTimezone } from "./utils/validation.js";
 
+// Formatter cache management
+export { clearZoneCache } from "./utils/zone-cache.js";
+
 // DST Detection functions
-export { isDST, isBST } from "./dst-detector.js";
+export {
+  isDST,
+  isDSTBatch,
+  isDSTUnchecked,
+  isBST,
+} from "./dst-detector.js";
 
 // Time formatting functions
 export { toTimezoneString, toLondonString } from "./formatter.js";
@@ -46,19 +55,26 @@ export { toTimezoneString, toLondonString } from "./formatter.js";
 // Time conversion functions
 export {
   toTimezoneParts,
+  toTimezonePartsBatch,
+  toTimezonePartsUnchecked,
   toLondonParts,
   fromTimezoneParts,
+  fromTimezonePartsBatch,
+  fromTimezonePartsUnchecked,
   fromLondonParts,
 } from "./time-converter.js";
 
 // UTC formatting functions
-export { toUTCString } from "./utc-formatter.js";
+export { toUTCString, toUTCStringBatch } from "./utc-formatter.js";
 
 // Working hours and business day functions
 export {
   inWorkingHours,
+  inWorkingHoursBatch,
   inWorkingHoursLondon,
   isWorkingDay,
+  isWorkingDayBatch,
+  isWorkingMoment,
 } from "./working-hours.js";
 
 // DST transition utilities
@@ -2,8 +2,11 @@
  * Time conversion utilities for timezone-aware operations
  */
 
-import type { TimeParts } from "./types.js";
-import { getTimezoneMetadata } from "./timezone-registry.js";
+import type { TimeParts, TimePartsArray } from "./types.js";
+import {
+  getTimezoneMetadata,
+  isHardcodedTimezone,
+} from "./timezone-registry.js";
 import {
   validateDate,
   validateTimezone,
@@ -11,6 +14,8 @@ import {
   validatePlatformTimezone,
 } from "./utils/validation.js";
 import { timezoneDetector } from "./timezone-detector.js";
+import { readLocalTimeParts, getTimezoneOffset } from "./utils/date-utils.js";
+import { getOffsetAt } from "./utils/transition-table.js";
 
 /**
  * Extract timezone-local time components from a UTC Date
@@ -54,28 +59,100 @@ export function toTimezoneParts(date: Date, timezone?: string): TimeParts {
 
   validatePlatformTimezone(effectiveTimezone);
 
-  // Use Intl.DateTimeFormat to get timezone-local components
-  const formatter = new Intl.DateTimeFormat("en-CA", {
-    timeZone: effectiveTimezone,
-    year: "numeric",
-    month: "2-digit",
-    day: "2-digit",
-    hour: "2-digit",
-    minute: "2-digit",
-    second: "2-digit",
-    hour12: false,
-  });
-
-  const parts = formatter.formatToParts(date);
-
-  return {
-    year: parseInt(parts.find((p) => p.type === "year")?.value ?? "0"),
-    month: parseInt(parts.find((p) => p.type === "month")?.value ?? "0"),
-    day: parseInt(parts.find((p) => p.type === "day")?.value ?? "0"),
-    hour: parseInt(parts.find((p) => p.type === "hour")?.value ?? "0"),
-    minute: parseInt(parts.find((p) => p.type === "minute")?.value ?? "0"),
-    second: parseInt(parts.find((p) => p.type === "second")?.value ?? "0"),
+  return toTimezonePartsUnchecked(date, effectiveTimezone);
+}
+
+/**
+ * Extract timezone-local time components without validating the inputs
+ *
+ * For callers that have already validated the date and the timezone (for
+ * example once per batch). Passing an invalid date or an identifier the
+ * platform does not support gives undefined results.
+ *
+ * @param date - A valid date within the supported range
+ * @param timezone - A supported IANA timezone identifier
+ * @returns TimeParts object with local time components
+ */
+export function toTimezonePartsUnchecked(
+  date: Date,
+  timezone: string
+): TimeParts {
+  // Always build the object in the same key order so it keeps one shape
+  const parts = { year: 0, month: 0, day: 0, hour: 0, minute: 0, second: 0 };
+  return readTimezoneParts(date, timezone, parts);
+}
+
+/**
+ * Extract timezone-local time components for many UTC Dates at once
+ *
+ * Batch counterpart of toTimezoneParts. The timezone is resolved and validated
+ * once for the whole batch, and the components are written into parallel typed
+ * arrays instead of allocating one TimeParts object per date.
+ *
+ * @param dates - The UTC dates to convert (each must be a valid Date object)
+ * @param timezone - IANA timezone identifier (optional, auto-detects if omitted)
+ * @returns TimePartsArray where index `i` holds the local components of `dates[i]`
+ *
+ * @throws {Error} If any date is invalid (NaN) or outside supported range (1970-2100)
+ * @throws {Error} If timezone is not supported or unavailable on platform
+ * @throws {TimezoneDetectionError} If timezone detection fails and fallback is invalid
+ *
+ * @example
+ * ```typescript
+ * const dates = [
+ *   new Date('2024-01-15T12:00:00Z'),
+ *   new Date('2024-07-15T12:00:00Z'),
+ * ];
+ * const parts = toTimezonePartsBatch(dates, 'Europe/London');
+ * console.log(parts.hour);  // Uint8Array [12, 13] (GMT, BST)
+ * ```
+ */
+export function toTimezonePartsBatch(
+  dates: readonly Date[],
+  timezone?: string
+): TimePartsArray {
+  // Use auto-detection if no timezone provided
+  const effectiveTimezone = timezone ?? timezoneDetector.getDetectedTimezone();
+  validateTimezone(effectiveTimezone);
+
+  validatePlatformTimezone(effectiveTimezone);
+
+  // Validate the whole batch up front so the conversion loops stay unchecked
+  for (const date of dates) {
+    validateDate(date);
+  }
+
+  const count = dates.length;
+  const result: TimePartsArray = {
+    year: new Uint16Array(count),
+    month: new Uint8Array(count),
+    day: new Uint8Array(count),
+    hour: new Uint8Array(count),
+    minute: new Uint8Array(count),
+    second: new Uint8Array(count),
+  };
+
+  // Reused for every date so the loop does not allocate a TimeParts object
+  const row: TimeParts = {
+    year: 0,
+    month: 0,
+    day: 0,
+    hour: 0,
+    minute: 0,
+    second: 0,
   };
+
+  for (let i = 0; i < count; i++) {
+    readTimezoneParts(dates[i]!, effectiveTimezone, row);
+    result.year[i] = row.year;
+    result.month[i] = row.month;
+    result.day[i] = row.day;
+    result.hour[i] = row.hour;
+    result.minute[i] = row.minute;
+    result.second[i] = row.second;
+  }
+
+  return result;
 }
 
 /**
@@ -108,14 +185,14 @@ export function toLondonParts(date: Date): TimeParts {
  * Create a UTC Date from timezone-local time components
  *
  * Converts timezone-local time parts into a UTC Date object, properly handling
- * DST edge cases. Uses a ±180 minute search window with 1-minute resolution to
- * resolve ambiguous times.
+ * DST edge cases. The offset in force is read at most twice, starting from a
+ * standard-time guess.
  *
  * When no timezone is provided, automatically detects the user's timezone.
  *
  * **DST Edge Case Handling:**
- * - **Spring forward gaps**: Non-existent times are advanced to the first valid time
- * - **Autumn fallback duplicates**: Ambiguous times resolve to first occurrence (DST time)
+ * - **Spring forward gaps**: Non-existent times are advanced by the length of the gap
+ * - **Autumn fallback duplicates**: Ambiguous times resolve to the standard-time occurrence
  *
  * @param parts - The local time components in the specified timezone
  * @param timezone - IANA timezone identifier (optional, auto-detects if omitted)
@@ -123,7 +200,6 @@ export function toLondonParts(date: Date): TimeParts {
  *
  * @throws {Error} If time parts are invalid (e.g., month 13, hour 25)
  * @throws {Error} If timezone is not supported or unavailable on platform
- * @throws {Error} If time cannot be resolved after exhaustive search
  * @throws {TimezoneDetectionError} If timezone detection fails and fallback is invalid
  *
  * @example
@@ -142,7 +218,7 @@ export function toLondonParts(date: Date): TimeParts {
  * const gapParts = { year: 2024, month: 3, day: 31, hour: 1, minute: 30, second: 0 };
  * const resolvedGap = fromTimezoneParts(gapParts, 'Europe/London');
  * const resolvedLocal = toTimezoneParts(resolvedGap, 'Europe/London');
- * console.log(resolvedLocal.hour); // 2 (or later) - advanced to valid time
+ * console.log(resolvedLocal.hour); // 2 - advanced past the gap to 02:30 BST
  * ```
  */
 export function fromTimezoneParts(parts: TimeParts, timezone?: string): Date {
@@ -152,68 +228,104 @@ export function fromTimezoneParts(parts: TimeParts, timezone?: string): Date {
   const effectiveTimezone = timezone ?? timezoneDetector.getDetectedTimezone();
   validateTimezone(effectiveTimezone);
 
-  const metadata = getTimezoneMetadata(effectiveTimezone);
+  // Reject unsupported timezones before checking platform availability
+  getTimezoneMetadata(effectiveTimezone);
   validatePlatformTimezone(effectiveTimezone);
 
-  // Build initial guess using UTC constructor, then adjust for timezone offset
-  // Start with a UTC date and adjust by the expected timezone offset
-  const utcGuess = new Date(
-    Date.UTC(
-      parts.year,
-      parts.month - 1,
-      parts.day,
-      parts.hour,
-      parts.minute,
-      parts.second
-    )
+  return fromTimezonePartsUnchecked(parts, effectiveTimezone);
+}
+
+/**
+ * Create a UTC Date from timezone-local time components without validation
+ *
+ * For callers that have already validated the parts and the timezone (for
+ * example once per batch). Passing out-of-range parts or an identifier the
+ * platform does not support gives undefined results.
+ *
+ * @param parts - Valid local time components in the timezone
+ * @param timezone - A supported IANA timezone identifier
+ * @returns UTC Date object
+ */
+export function fromTimezonePartsUnchecked(
+  parts: TimeParts,
+  timezone: string
+): Date {
+  const metadata = getTimezoneMetadata(timezone);
+
+  // Read the local parts as if they were UTC, then correct by the zone offset
+  const localTime = Date.UTC(
+    parts.year,
+    parts.month - 1,
+    parts.day,
+    parts.hour,
+    parts.minute,
+    parts.second
   );
 
-  // Adjust by the standard timezone offset to get closer to the correct UTC time
-  const offsetAdjustment = metadata.standardOffset * 60000; // Convert minutes to milliseconds
-  const guess = new Date(utcGuess.getTime() - offsetAdjustment);
-
-  // Search within ±180 minutes, 1-minute steps for matching timezone parts
-  for (let offset = 0; offset <= 180; offset++) {
-    const candidates =
-      offset === 0
-        ? [guess]
-        : [
-            new Date(guess.getTime() + offset * 60000),
-            new Date(guess.getTime() - offset * 60000),
-          ];
-
-    for (const candidate of candidates) {
-      if (matchesTimezoneParts(candidate, parts, effectiveTimezone)) {
-        return candidate; // First match wins
-      }
-    }
-  }
+  return new Date(
+    resolveLocalTime(localTime, metadata.standardOffset, timezone)
+  );
+}
+
+/**
+ * Create UTC Dates from many sets of timezone-local time components at once
+ *
+ * Batch counterpart of fromTimezoneParts taking the parallel-array layout
+ * produced by toTimezonePartsBatch. The timezone is resolved and validated
+ * once for the whole batch.
+ *
+ * @param parts - Local time components; index `i` across all arrays is one time
+ * @param timezone - IANA timezone identifier (optional, auto-detects if omitted)
+ * @returns UTC Date objects, index-aligned with the input arrays
+ *
+ * @throws {Error} If any set of time parts is invalid (e.g., month 13, hour 25)
+ * @throws {Error} If timezone is not supported or unavailable on platform
+ * @throws {TimezoneDetectionError} If timezone detection fails and fallback is invalid
+ *
+ * @example
+ * ```typescript
+ * const local = toTimezonePartsBatch(dates, 'Europe/London');
+ * const roundTrip = fromTimezonePartsBatch(local, 'Europe/London');
+ * ```
+ */
+export function fromTimezonePartsBatch(
+  parts: TimePartsArray,
+  timezone?: string
+): Date[] {
+  // Use auto-detection if no timezone provided
+  const effectiveTimezone = timezone ?? timezoneDetector.getDetectedTimezone();
+  validateTimezone(effectiveTimezone);
+
+  // Reject unsupported timezones before checking platform availability
+  getTimezoneMetadata(effectiveTimezone);
+  validatePlatformTimezone(effectiveTimezone);
+
+  const count = parts.year.length;
+  const result = new Array<Date>(count);
+
+  // Reused for validation so each row does not allocate a TimeParts object
+  const row: TimeParts = {
+    year: 0,
+    month: 0,
+    day: 0,
+    hour: 0,
+    minute: 0,
+    second: 0,
+  };
 
-  // If no exact match found, try to find the closest valid time after the requested time
-  // This handles spring forward gaps by advancing to the first valid time
-  for (let offset = 0; offset <= 180; offset += 60) {
-    // Check every hour
-    const candidate = new Date(guess.getTime() + offset * 60000);
-    try {
-      const candidateParts = toTimezoneParts(candidate, effectiveTimezone);
-      // If we can get parts and the date/time is reasonable, use it
-      if (
-        candidateParts.year === parts.year &&
-        candidateParts.month === parts.month &&
-        candidateParts.day === parts.day
-      ) {
-        return candidate;
-      }
-    } catch {
-      // Continue searching
-    }
+  for (let i = 0; i < count; i++) {
+    row.year = parts.year[i]!;
+    row.month = parts.month[i]!;
+    row.day = parts.day[i]!;
+    row.hour = parts.hour[i]!;
+    row.minute = parts.minute[i]!;
+    row.second = parts.second[i]!;
+    validateTimeParts(row);
+
+    result[i] = fromTimezonePartsUnchecked(row, effectiveTimezone);
   }
 
-  throw new Error(
-    `Cannot resolve time parts for ${effectiveTimezone}: ${JSON.stringify(
-      parts
-    )}. ` + `This may be a non-existent time during DST transition.`
-  );
+  return result;
 }
 
 /**
@@ -227,29 +339,88 @@ export function fromLondonParts(parts: TimeParts): Date {
 }
 
 /**
- * Check if a UTC date produces the expected timezone-local parts
- * @param utcDate - The UTC date to test
- * @param expectedParts - The expected local time parts
+ * Read the local clock components of an instant into an existing object
+ * @param date - A valid date within the supported range
+ * @param timezone - A supported IANA timezone identifier
+ * @param out - Receives the local time components
+ * @returns `out`
+ */
+function readTimezoneParts(
+  date: Date,
+  timezone: string,
+  out: TimeParts
+): TimeParts {
+  // Fixed-offset zones need no timezone database lookup at all
+  const fixedOffset = getFixedOffset(timezone);
+  if (fixedOffset === undefined) {
+    return readLocalTimeParts(date, timezone, out);
+  }
+
+  const local = new Date(date.getTime() + fixedOffset * 60000);
+  out.year = local.getUTCFullYear();
+  out.month = local.getUTCMonth() + 1;
+  out.day = local.getUTCDate();
+  out.hour = local.getUTCHours();
+  out.minute = local.getUTCMinutes();
+  out.second = local.getUTCSeconds();
+  return out;
+}
+
+/**
+ * Find the UTC instant at which a timezone's wall clock shows a local time
+ * @param localTime - Local wall-clock time read as if it were UTC (ms)
+ * @param standardOffset - The timezone's standard offset in minutes
  * @param timezone - The timezone identifier
- * @returns True if the UTC date produces the expected local parts
+ * @returns UTC instant in milliseconds since the epoch
  */
-function matchesTimezoneParts(
-  utcDate: Date,
-  expectedParts: TimeParts,
+function resolveLocalTime(
+  localTime: number,
+  standardOffset: number,
   timezone: string
-): boolean {
-  try {
-    const actualParts = toTimezoneParts(utcDate, timezone);
-
-    return (
-      actualParts.year === expectedParts.year &&
-      actualParts.month === expectedParts.month &&
-      actualParts.day === expectedParts.day &&
-      actualParts.hour === expectedParts.hour &&
-      actualParts.minute === expectedParts.minute &&
-      actualParts.second === expectedParts.second
-    );
-  } catch {
-    return false;
+): number {
+  // First guess assumes standard time, so ambiguous times resolve to their
+  // standard-time occurrence
+  const standardGuess = localTime - standardOffset * 60000;
+  const guessOffset = offsetAt(standardGuess, timezone);
+  if (guessOffset === standardOffset) {
+    return standardGuess;
+  }
+
+  // Otherwise retry with the offset actually in force around that instant
+  const candidate = localTime - guessOffset * 60000;
+  if (offsetAt(candidate, timezone) === guessOffset) {
+    return candidate;
   }
+
+  // Neither offset reproduces the parts: the local time falls in a
+  // spring-forward gap. Keeping the pre-transition offset advances the wall
+  // clock by the length of the gap.
+  return standardGuess;
+}
+
+/**
+ * Get the UTC offset in force at an instant
+ * @param time - UTC instant in milliseconds since the epoch
+ * @param timezone - The timezone identifier
+ * @returns Offset in minutes from UTC
+ */
+function offsetAt(time: number, timezone: string): number {
+  // Registry timezones answer from the precomputed transition table
+  return isHardcodedTimezone(timezone)
+    ? getOffsetAt(time, timezone)
+    : getTimezoneOffset(new Date(time), timezone);
+}
+
+/**
+ * Get the constant UTC offset of a registry timezone that never observes DST
+ * @param timezone - The timezone identifier
+ * @returns Offset in minutes from UTC, or undefined if the offset can vary
+ */
+function getFixedOffset(timezone: string): number | undefined {
+  if (!isHardcodedTimezone(timezone)) {
+    return undefined;
+  }
+
+  const metadata = getTimezoneMetadata(timezone);
+  return metadata.dstOffset ? undefined : metadata.standardOffset;
 }
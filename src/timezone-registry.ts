@@ -14,9 +14,14 @@ import { runtimeRegistry } from "./runtime-registry.js";
 
 /**
  * Registry of supported timezone metadata
+ *
+ * Entries are frozen: they are shared by every caller and by the memoized
+ * lookups below, so they must never be mutated.
  */
-export const TIMEZONE_REGISTRY: Record<SupportedTimezone, TimezoneMetadata> = {
-  "Europe/London": {
+export const TIMEZONE_REGISTRY: Readonly<
+  Record<SupportedTimezone, TimezoneMetadata>
+> = Object.freeze({
+  "Europe/London": freezeMetadata({
     id: "Europe/London",
     standardOffset: 0, // GMT is UTC+0
     dstOffset: 60, // BST is UTC+1
@@ -25,9 +30,9 @@ export const TIMEZONE_REGISTRY: Record<SupportedTimezone, TimezoneMetadata> = {
       dst: "BST",
     },
     fallbackFormat: "GMT{offset}",
-  },
+  }),
 
-  "America/New_York": {
+  "America/New_York": freezeMetadata({
     id: "America/New_York",
     standardOffset: -300, // EST is UTC-5
     dstOffset: -240, // EDT is UTC-4
@@ -36,9 +41,9 @@ export const TIMEZONE_REGISTRY: Record<SupportedTimezone, TimezoneMetadata> = {
       dst: "EDT",
     },
     fallbackFormat: "GMT{offset}",
-  },
+  }),
 
-  "America/Los_Angeles": {
+  "America/Los_Angeles": freezeMetadata({
     id: "America/Los_Angeles",
     standardOffset: -480, // PST is UTC-8
     dstOffset: -420, // PDT is UTC-7
@@ -47,9 +52,9 @@ export const TIMEZONE_REGISTRY: Record<SupportedTimezone, TimezoneMetadata> = {
       dst: "PDT",
     },
     fallbackFormat: "GMT{offset}",
-  },
+  }),
 
-  "Europe/Paris": {
+  "Europe/Paris": freezeMetadata({
     id: "Europe/Paris",
     standardOffset: 60, // CET is UTC+1
     dstOffset: 120, // CEST is UTC+2
@@ -58,9 +63,9 @@ export const TIMEZONE_REGISTRY: Record<SupportedTimezone, TimezoneMetadata> = {
       dst: "CEST",
     },
     fallbackFormat: "GMT{offset}",
-  },
+  }),
 
-  "Europe/Berlin": {
+  "Europe/Berlin": freezeMetadata({
     id: "Europe/Berlin",
     standardOffset: 60, // CET is UTC+1
     dstOffset: 120, // CEST is UTC+2
@@ -69,16 +74,16 @@ export const TIMEZONE_REGISTRY: Record<SupportedTimezone, TimezoneMetadata> = {
       dst: "CEST",
     },
     fallbackFormat: "GMT{offset}",
-  },
+  }),
 
-  "Asia/Tokyo": {
+  "Asia/Tokyo": freezeMetadata({
     id: "Asia/Tokyo",
     standardOffset: 540, // JST is UTC+9
     // No DST in Japan
     fallbackFormat: "GMT{offset}",
-  },
+  }),
 
-  "Australia/Sydney": {
+  "Australia/Sydney": freezeMetadata({
     id: "Australia/Sydney",
     standardOffset: 600, // AEST is UTC+10
     dstOffset: 660, // AEDT is UTC+11
@@ -87,8 +92,28 @@ export const TIMEZONE_REGISTRY: Record<SupportedTimezone, TimezoneMetadata> = {
       dst: "AEDT",
     },
     fallbackFormat: "GMT{offset}",
-  },
-};
+  }),
+});
+
+/**
+ * Identifiers in the hardcoded registry, for O(1) membership checks that
+ * cannot be fooled by inherited object keys such as "toString"
+ */
+export const HARDCODED_TIMEZONES: ReadonlySet<string> = new Set(
+  Object.keys(TIMEZONE_REGISTRY)
+);
+
+/**
+ * Deep-freeze a registry entry
+ * @param metadata - Timezone metadata to freeze
+ * @returns The same metadata object, frozen
+ */
+function freezeMetadata(metadata: TimezoneMetadata): TimezoneMetadata {
+  if (metadata.preferredAbbreviations) {
+    Object.freeze(metadata.preferredAbbreviations);
+  }
+  return Object.freeze(metadata);
+}
 
 /**
  * Get timezone metadata for a supported timezone
@@ -100,9 +125,8 @@ export function getTimezoneMetadata(
   timezone: string
 ): TimezoneMetadata | RuntimeTimezoneMetadata {
   // First check hardcoded registry
-  const hardcodedMetadata = TIMEZONE_REGISTRY[timezone as SupportedTimezone];
-  if (hardcodedMetadata) {
-    return hardcodedMetadata;
+  if (HARDCODED_TIMEZONES.has(timezone)) {
+    return TIMEZONE_REGISTRY[timezone as SupportedTimezone];
   }
 
   // If not in hardcoded registry, try runtime registry
@@ -124,7 +148,7 @@ export function getTimezoneMetadata(
  */
 export function isSupportedTimezone(timezone: string): boolean {
   // Check hardcoded registry first
-  if (timezone in TIMEZONE_REGISTRY) {
+  if (HARDCODED_TIMEZONES.has(timezone)) {
     return true;
   }
 
@@ -140,7 +164,7 @@ export function isSupportedTimezone(timezone: string): boolean {
 export function isHardcodedTimezone(
   timezone: string
 ): timezone is SupportedTimezone {
-  return timezone in TIMEZONE_REGISTRY;
+  return HARDCODED_TIMEZONES.has(timezone);
 }
 
 /**
@@ -20,6 +20,26 @@ export interface TimeParts {
   second: number;
 }
 
+/**
+ * Time components for many instants, stored as parallel arrays
+ *
+ * Index `i` of every array describes the same instant.
+ */
+export interface TimePartsArray {
+  /** Years (e.g., 2024) */
+  year: Uint16Array;
+  /** Months (1-12) */
+  month: Uint8Array;
+  /** Days of month (1-31) */
+  day: Uint8Array;
+  /** Hours (0-23) */
+  hour: Uint8Array;
+  /** Minutes (0-59) */
+  minute: Uint8Array;
+  /** Seconds (0-59) */
+  second: Uint8Array;
+}
+
 /**
  * Metadata for supported timezones
  */
@@ -3,7 +3,6 @@
  */
 
 import { validateDate } from "./utils/validation.js";
-import { pad } from "./utils/formatting.js";
 
 /**
  * Format a Date as a stable UTC string in "YYYY-MM-DD HH:mm:ss.SSSSSZ" format
@@ -38,16 +37,34 @@ import { pad } from "./utils/formatting.js";
 export function toUTCString(date: Date): string {
   validateDate(date);
 
-  const year = date.getUTCFullYear();
-  const month = pad(date.getUTCMonth() + 1, 2); // getUTCMonth() is 0-indexed
-  const day = pad(date.getUTCDate(), 2);
-  const hours = pad(date.getUTCHours(), 2);
-  const minutes = pad(date.getUTCMinutes(), 2);
-  const seconds = pad(date.getUTCSeconds(), 2);
-  const milliseconds = date.getUTCMilliseconds().toString().padStart(3, "0");
+  // toISOString() already yields zero-padded "YYYY-MM-DDTHH:mm:ss.sssZ" in a
+  // single native call; the supported range always has a 4-digit year
+  const iso = date.toISOString();
 
   // Pad milliseconds to 6 digits for microsecond precision
-  const microseconds = milliseconds + "000";
+  return `${iso.slice(0, 10)} ${iso.slice(11, 23)}000Z`;
+}
 
-  return `${year}-${month}-${day} ${hours}:${minutes}:${seconds}.${microseconds}Z`;
+/**
+ * Format many Dates as stable UTC strings in "YYYY-MM-DD HH:mm:ss.SSSSSZ" format
+ *
+ * Batch counterpart of toUTCString.
+ *
+ * @param dates - The dates to format (each must be a valid Date object)
+ * @returns Formatted UTC strings, in the same order as `dates`
+ *
+ * @throws {Error} If any date is invalid (NaN) or outside supported range (1970-2100)
+ *
+ * @example
+ * ```typescript
+ * toUTCStringBatch([new Date('2024-07-15T14:35:42.123Z')]);
+ * // ["2024-07-15 14:35:42.123000Z"]
+ * ```
+ */
+export function toUTCStringBatch(dates: readonly Date[]): string[] {
+  const result = new Array<string>(dates.length);
+  for (let i = 0; i < dates.length; i++) {
+    result[i] = toUTCString(dates[i]!);
+  }
+  return result;
 }
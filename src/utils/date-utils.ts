@@ -2,6 +2,19 @@
  * Date and time utility functions
  */
 
+import type { TimeParts } from "../types.js";
+import { getPartsFormatter } from "./zone-cache.js";
+
+/**
+ * Days in each month of a non-leap year
+ */
+const DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31] as const;
+
+/**
+ * Month offsets for Sakamoto's day-of-week algorithm
+ */
+const WEEKDAY_MONTH_OFFSETS = [0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4] as const;
+
 /**
  * Check if a year is a leap year
  * @param year - Year to check
@@ -18,11 +31,92 @@ export function isLeapYear(year: number): boolean {
  * @returns Number of days in the month
  */
 export function getDaysInMonth(year: number, month: number): number {
-  const daysInMonth = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31];
   if (month === 2 && isLeapYear(year)) {
     return 29;
   }
-  return daysInMonth[month - 1] ?? 30;
+  return DAYS_IN_MONTH[month - 1] ?? 30;
+}
+
+/**
+ * Get the day of week for a calendar date without constructing a Date
+ * @param year - Year
+ * @param month - Month (1-12)
+ * @param day - Day of month
+ * @returns Day of week (0=Sunday, 1=Monday, etc.)
+ */
+export function getDayOfWeek(year: number, month: number, day: number): number {
+  // Sakamoto's algorithm: January and February count towards the prior year
+  const y = month < 3 ? year - 1 : year;
+  return (
+    (y +
+      Math.floor(y / 4) -
+      Math.floor(y / 100) +
+      Math.floor(y / 400) +
+      WEEKDAY_MONTH_OFFSETS[month - 1]! +
+      day) %
+    7
+  );
+}
+
+/**
+ * Read the local clock components of an instant in a timezone
+ *
+ * Performs no validation; callers are expected to have validated the date and
+ * confirmed the timezone is available on the platform.
+ *
+ * @param date - The instant to read
+ * @param timezone - The timezone identifier
+ * @returns Local time components (month is 1-12)
+ * @throws RangeError if the timezone is not available on the platform
+ */
+export function getLocalTimeParts(date: Date, timezone: string): TimeParts {
+  // Always build the object in the same key order so it keeps one shape
+  const parts = { year: 0, month: 0, day: 0, hour: 0, minute: 0, second: 0 };
+  return readLocalTimeParts(date, timezone, parts);
+}
+
+/**
+ * Read the local clock components of an instant into an existing object
+ *
+ * Lets batch callers reuse one scratch object instead of allocating a
+ * TimeParts per instant. Performs no validation, like getLocalTimeParts.
+ *
+ * @param date - The instant to read
+ * @param timezone - The timezone identifier
+ * @param out - Receives the local time components (month is 1-12)
+ * @returns `out`
+ * @throws RangeError if the timezone is not available on the platform
+ */
+export function readLocalTimeParts(
+  date: Date,
+  timezone: string,
+  out: TimeParts
+): TimeParts {
+  // Single pass over the parts instead of one find() per component
+  for (const part of getPartsFormatter(timezone).formatToParts(date)) {
+    switch (part.type) {
+      case "year":
+        out.year = Number(part.value);
+        break;
+      case "month":
+        out.month = Number(part.value);
+        break;
+      case "day":
+        out.day = Number(part.value);
+        break;
+      case "hour":
+        out.hour = Number(part.value);
+        break;
+      case "minute":
+        out.minute = Number(part.value);
+        break;
+      case "second":
+        out.second = Number(part.value);
+        break;
+    }
+  }
+
+  return out;
 }
 
 /**
@@ -36,32 +130,17 @@ export function getTimezoneOffset(date: Date, timezone: string): number {
     const utcTime = date.getTime();
 
     // Get the local time in the target timezone
-    const formatter = new Intl.DateTimeFormat("en-CA", {
-      timeZone: timezone,
-      year: "numeric",
-      month: "2-digit",
-      day: "2-digit",
-      hour: "2-digit",
-      minute: "2-digit",
-      second: "2-digit",
-      hour12: false,
-    });
-
-    const parts = formatter.formatToParts(date);
-    const year = parseInt(parts.find((p) => p.type === "year")?.value ?? "0");
-    const month =
-      parseInt(parts.find((p) => p.type === "month")?.value ?? "0") - 1; // Month is 0-indexed
-    const day = parseInt(parts.find((p) => p.type === "day")?.value ?? "0");
-    const hour = parseInt(parts.find((p) => p.type === "hour")?.value ?? "0");
-    const minute = parseInt(
-      parts.find((p) => p.type === "minute")?.value ?? "0"
-    );
-    const second = parseInt(
-      parts.find((p) => p.type === "second")?.value ?? "0"
-    );
+    const parts = getLocalTimeParts(date, timezone);
 
     // Create a UTC date object from the timezone-local components
-    const localTime = Date.UTC(year, month, day, hour, minute, second);
+    const localTime = Date.UTC(
+      parts.year,
+      parts.month - 1, // Month is 0-indexed
+      parts.day,
+      parts.hour,
+      parts.minute,
+      parts.second
+    );
 
     // Calculate the offset: (local time - UTC time) / (1000 * 60) = offset in minutes
     const offsetMinutes = (localTime - utcTime) / (1000 * 60);
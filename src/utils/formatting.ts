@@ -12,15 +12,51 @@ export function pad(num: number, length: number): string {
   return num.toString().padStart(length, "0");
 }
 
+/**
+ * Range of offsets (in minutes) covered by the precomputed offset strings;
+ * every real-world UTC offset lies on a quarter hour between UTC-12 and UTC+14
+ */
+const MIN_TABLE_OFFSET = -12 * 60;
+const MAX_TABLE_OFFSET = 14 * 60;
+const TABLE_STEP = 15;
+
+/**
+ * Precomputed GMT±HH:MM strings for every quarter-hour offset in range
+ */
+const OFFSET_STRINGS: readonly string[] = Array.from(
+  { length: (MAX_TABLE_OFFSET - MIN_TABLE_OFFSET) / TABLE_STEP + 1 },
+  (_, i) => buildOffsetString(MIN_TABLE_OFFSET + i * TABLE_STEP)
+);
+
 /**
  * Format offset in minutes to GMT±HH:MM format
  * @param offsetMinutes - Offset in minutes from UTC
  * @returns Formatted offset string (e.g., 'GMT+01:00', 'GMT-05:00')
  */
 export function formatOffset(offsetMinutes: number): string {
+  if (
+    offsetMinutes % TABLE_STEP === 0 &&
+    offsetMinutes >= MIN_TABLE_OFFSET &&
+    offsetMinutes <= MAX_TABLE_OFFSET
+  ) {
+    return OFFSET_STRINGS[(offsetMinutes - MIN_TABLE_OFFSET) / TABLE_STEP]!;
+  }
+
+  return buildOffsetString(offsetMinutes);
+}
+
+/**
+ * Build a GMT±HH:MM string for an offset
+ * @param offsetMinutes - Offset in minutes from UTC
+ * @returns Formatted offset string
+ */
+function buildOffsetString(offsetMinutes: number): string {
   const sign = offsetMinutes >= 0 ? "+" : "-";
   const absMinutes = Math.abs(offsetMinutes);
   const hours = Math.floor(absMinutes / 60);
   const minutes = absMinutes % 60;
-  return `GMT${sign}${pad(hours, 2)}:${pad(minutes, 2)}`;
+  // Offsets never exceed two hour digits, so pad inline instead of via pad()
+  const hh = hours < 10 ? `0${hours}` : `${hours}`;
+  const mm = minutes < 10 ? `0${minutes}` : `${minutes}`;
+  return `GMT${sign}${hh}:${mm}`;
 }
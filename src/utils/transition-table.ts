@@ -0,0 +1,214 @@
+/**
+ * Precomputed UTC offset transitions for registry timezones
+ *
+ * The platform timezone database is probed once per (timezone, year) and the
+ * result is stored as sorted transition instants with the offset in force from
+ * each instant. Subsequent lookups are a binary search over a handful of
+ * entries instead of an Intl.DateTimeFormat call. The segment matched last is
+ * remembered per timezone, so consecutive lookups within the same stretch of
+ * constant offset (the common case for log-style workloads) skip the search.
+ *
+ * Offset changes are assumed to be at least a week apart, which holds for
+ * every timezone in the hardcoded registry.
+ */
+
+import { getTimezoneOffset } from "./date-utils.js";
+import { onZoneCacheClear } from "./zone-cache.js";
+
+const MINUTE_MS = 60 * 1000;
+const PROBE_STEP_MS = 7 * 24 * 60 * MINUTE_MS;
+
+/**
+ * Offset segments for a single UTC calendar year
+ */
+interface YearTable {
+  /** UTC instants (ms) at which each segment starts; the first is January 1st 00:00 UTC */
+  starts: Float64Array;
+  /** UTC offset in minutes in force for each segment */
+  offsets: Int16Array;
+}
+
+/**
+ * A stretch of time over which a timezone's offset is constant
+ */
+interface Segment {
+  /** First UTC instant (ms) of the segment, inclusive */
+  start: number;
+  /** UTC instant (ms) at which the segment ends, exclusive */
+  end: number;
+  /** UTC offset in minutes in force throughout the segment */
+  offset: number;
+}
+
+const tables = new Map<string, Map<number, YearTable>>();
+const lastSegments = new Map<string, Segment>();
+
+onZoneCacheClear(() => {
+  tables.clear();
+  lastSegments.clear();
+});
+
+/**
+ * Get the UTC offset in force at an instant, using the precomputed table
+ * @param time - UTC instant in milliseconds since the epoch
+ * @param timezone - Timezone identifier from the hardcoded registry
+ * @returns Offset in minutes from UTC (positive for east of UTC)
+ */
+export function getOffsetAt(time: number, timezone: string): number {
+  const last = lastSegments.get(timezone);
+  if (last && time >= last.start && time < last.end) {
+    return last.offset;
+  }
+
+  const year = new Date(time).getUTCFullYear();
+  const table = getYearTable(timezone, year);
+  const index = findSegment(table, time);
+
+  // Segments are clipped to the table's year so the cache never spans tables
+  const segment: Segment = {
+    start: table.starts[index]!,
+    end: table.starts[index + 1] ?? Date.UTC(year + 1, 0, 1),
+    offset: table.offsets[index]!,
+  };
+  lastSegments.set(timezone, segment);
+
+  return segment.offset;
+}
+
+/**
+ * Get the UTC offsets in force at many instants, using the precomputed table
+ * @param times - UTC instants in milliseconds since the epoch
+ * @param timezone - Timezone identifier from the hardcoded registry
+ * @returns Offsets in minutes from UTC, index-aligned with `times`
+ */
+export function lookupOffsets(
+  times: Float64Array,
+  timezone: string
+): Int16Array {
+  const result = new Int16Array(times.length);
+
+  // Reuse the current year's table until an instant falls outside that year
+  let table: YearTable | undefined;
+  let tableStart = 0;
+  let tableEnd = 0;
+
+  for (let i = 0; i < times.length; i++) {
+    const time = times[i]!;
+    if (!table || time < tableStart || time >= tableEnd) {
+      const year = new Date(time).getUTCFullYear();
+      table = getYearTable(timezone, year);
+      tableStart = Date.UTC(year, 0, 1);
+      tableEnd = Date.UTC(year + 1, 0, 1);
+    }
+    result[i] = table.offsets[findSegment(table, time)]!;
+  }
+
+  return result;
+}
+
+/**
+ * Binary search a year table for the segment in force at an instant
+ * @param table - Offset segments for the instant's UTC year
+ * @param time - UTC instant in milliseconds since the epoch
+ * @returns Index of the segment containing `time`
+ */
+function findSegment(table: YearTable, time: number): number {
+  const { starts } = table;
+
+  // Find the last segment starting at or before `time`
+  let low = 0;
+  let high = starts.length - 1;
+  while (low < high) {
+    const mid = (low + high + 1) >> 1;
+    if (starts[mid]! <= time) {
+      low = mid;
+    } else {
+      high = mid - 1;
+    }
+  }
+
+  return low;
+}
+
+/**
+ * Get (building on first use) the offset table for a timezone and UTC year
+ * @param timezone - Timezone identifier
+ * @param year - UTC calendar year
+ * @returns Offset segments covering the whole year
+ */
+function getYearTable(timezone: string, year: number): YearTable {
+  let years = tables.get(timezone);
+  if (!years) {
+    years = new Map();
+    tables.set(timezone, years);
+  }
+
+  let table = years.get(year);
+  if (!table) {
+    table = buildYearTable(timezone, year);
+    years.set(year, table);
+  }
+
+  return table;
+}
+
+/**
+ * Probe the platform timezone database for every offset change in a year
+ * @param timezone - Timezone identifier
+ * @param year - UTC calendar year
+ * @returns Offset segments covering the whole year
+ */
+function buildYearTable(timezone: string, year: number): YearTable {
+  const yearStart = Date.UTC(year, 0, 1);
+  const yearEnd = Date.UTC(year + 1, 0, 1);
+
+  const starts: number[] = [yearStart];
+  const offsets: number[] = [offsetAt(yearStart, timezone)];
+
+  let previousTime = yearStart;
+  let previousOffset = offsets[0]!;
+
+  while (previousTime < yearEnd) {
+    const time = Math.min(previousTime + PROBE_STEP_MS, yearEnd);
+    const offset = offsetAt(time, timezone);
+
+    if (offset !== previousOffset) {
+      // Narrow the change down to the first minute with the new offset
+      let low = previousTime;
+      let high = time;
+      while (high - low > MINUTE_MS) {
+        const mid =
+          low + Math.floor((high - low) / MINUTE_MS / 2) * MINUTE_MS;
+        if (offsetAt(mid, timezone) === previousOffset) {
+          low = mid;
+        } else {
+          high = mid;
+        }
+      }
+
+      // A change exactly at yearEnd belongs to the next year's table
+      if (high < yearEnd) {
+        starts.push(high);
+        offsets.push(offsetAt(high, timezone));
+      }
+    }
+
+    previousTime = time;
+    previousOffset = offset;
+  }
+
+  return {
+    starts: Float64Array.from(starts),
+    offsets: Int16Array.from(offsets),
+  };
+}
+
+/**
+ * Read the UTC offset at an instant from the platform timezone database
+ * @param time - UTC instant in milliseconds since the epoch
+ * @param timezone - Timezone identifier
+ * @returns Offset in minutes from UTC
+ */
+function offsetAt(time: number, timezone: string): number {
+  return getTimezoneOffset(new Date(time), timezone);
+}
@@ -4,6 +4,40 @@
 
 import type { TimeParts } from "../types.js";
 import { getDaysInMonth } from "./date-utils.js";
+import {
+  getPartsFormatter,
+  onZoneCacheClear,
+  MAX_CACHED_ZONES,
+} from "./zone-cache.js";
+
+/**
+ * Timezones already confirmed to be available on the platform, as passed by
+ * the caller (so case variants are separate entries), oldest first and capped
+ * at MAX_CACHED_ZONES like the formatter cache
+ */
+const platformTimezones = new Set<string>();
+
+onZoneCacheClear(() => platformTimezones.clear());
+
+/**
+ * Supported date range (1970-2100) as UTC epoch milliseconds, end exclusive
+ */
+const MIN_SUPPORTED_TIME = Date.UTC(1970, 0, 1);
+const MAX_SUPPORTED_TIME = Date.UTC(2101, 0, 1);
+
+/**
+ * Allowed ranges for the clock fields of TimeParts, in validation order
+ */
+const CLOCK_PART_RANGES = [
+  ["hour", 0, 23],
+  ["minute", 0, 59],
+  ["second", 0, 59],
+] as const;
+
+/**
+ * Matches any string containing at least one non-whitespace character
+ */
+const NON_WHITESPACE = /\S/;
 
 /**
  * Validate a Date object
@@ -15,13 +49,15 @@ export function validateDate(date: Date): void {
     throw new Error("Invalid input: expected Date object");
   }
 
-  if (isNaN(date.getTime())) {
+  // Number.isNaN skips the argument coercion done by the global isNaN
+  const time = date.getTime();
+  if (Number.isNaN(time)) {
     throw new Error("Invalid date: date is NaN");
   }
 
-  // Check if date is within reasonable range (1970-2100)
-  const year = date.getFullYear();
-  if (year < 1970 || year > 2100) {
+  // Check if date is within reasonable range (1970-2100), comparing epoch
+  // milliseconds directly instead of deriving a calendar year
+  if (time < MIN_SUPPORTED_TIME || time >= MAX_SUPPORTED_TIME) {
     throw new Error(
       `Date outside supported range: ${date.toISOString()}. Supported range: 1970-2100`
     );
@@ -40,6 +76,32 @@ export function validateTimeParts(parts: TimeParts): void {
 
   const { year, month, day, hour, minute, second } = parts;
 
+  // Fast path for the common all-valid case: `(x | 0) === x` holds only for
+  // int32 integers, and anything rejected here falls through to the detailed
+  // checks below, which produce the error message
+  if (
+    (year | 0) === year &&
+    (month | 0) === month &&
+    (day | 0) === day &&
+    (hour | 0) === hour &&
+    (minute | 0) === minute &&
+    (second | 0) === second &&
+    year >= 1970 &&
+    year <= 2100 &&
+    month >= 1 &&
+    month <= 12 &&
+    day >= 1 &&
+    (day <= 28 || day <= getDaysInMonth(year, month)) &&
+    hour >= 0 &&
+    hour <= 23 &&
+    minute >= 0 &&
+    minute <= 59 &&
+    second >= 0 &&
+    second <= 59
+  ) {
+    return;
+  }
+
   // Validate types
   if (
     !Number.isInteger(year) ||
@@ -72,22 +134,13 @@ export function validateTimeParts(parts: TimeParts): void {
     );
   }
 
-  if (hour < 0 || hour > 23) {
-    throw new Error(
-      `Invalid time parts: hour ${hour} must be between 0 and 23`
-    );
-  }
-
-  if (minute < 0 || minute > 59) {
-    throw new Error(
-      `Invalid time parts: minute ${minute} must be between 0 and 59`
-    );
-  }
-
-  if (second < 0 || second > 59) {
-    throw new Error(
-      `Invalid time parts: second ${second} must be between 0 and 59`
-    );
+  for (const [field, min, max] of CLOCK_PART_RANGES) {
+    const value = parts[field];
+    if (value < min || value > max) {
+      throw new Error(
+        `Invalid time parts: ${field} ${value} must be between ${min} and ${max}`
+      );
+    }
   }
 }
 
@@ -97,7 +150,14 @@ export function validateTimeParts(parts: TimeParts): void {
  * @throws Error if the timezone is invalid
  */
 export function validateTimezone(timezone: string): void {
-  if (typeof timezone !== "string" || timezone.trim() === "") {
+  // Anything already accepted by the platform is a valid identifier
+  if (platformTimezones.has(timezone)) {
+    return;
+  }
+
+  // A single non-whitespace search rather than allocating a trimmed copy;
+  // \s matches exactly the characters trim() removes
+  if (typeof timezone !== "string" || !NON_WHITESPACE.test(timezone)) {
     throw new Error("Invalid timezone: expected non-empty string");
   }
 }
@@ -108,9 +168,13 @@ export function validateTimezone(timezone: string): void {
  * @throws Error if the timezone is not available on the platform
  */
 export function validatePlatformTimezone(timezone: string): void {
+  if (platformTimezones.has(timezone)) {
+    return;
+  }
+
   try {
-    // Test if Intl.DateTimeFormat supports this timezone
-    new Intl.DateTimeFormat("en", { timeZone: timezone });
+    // Test if Intl.DateTimeFormat supports this timezone (and warm the formatter cache)
+    getPartsFormatter(timezone);
   } catch (error) {
     throw new Error(
       `Timezone '${timezone}' not available on this system. ` +
@@ -118,4 +182,9 @@ export function validatePlatformTimezone(timezone: string): void {
         `Error: ${error instanceof Error ? error.message : String(error)}`
     );
   }
+
+  if (platformTimezones.size >= MAX_CACHED_ZONES) {
+    platformTimezones.delete(platformTimezones.values().next().value!);
+  }
+  platformTimezones.add(timezone);
 }
@@ -0,0 +1,56 @@
+/**
+ * Typed-array kernels for batch working hours checks
+ *
+ * Each kernel is a single monomorphic loop over local wall-clock times (UTC
+ * epoch milliseconds shifted by the zone offset) that writes 0/1 flags into a
+ * preallocated output array, keeping the hot loop free of object allocation
+ * and of any per-item validation.
+ */
+
+const MINUTE_MS = 60 * 1000;
+const DAY_MS = 24 * 60 * MINUTE_MS;
+
+/**
+ * Flag local times that fall within working hours
+ * @param localTimes - Local wall-clock times as epoch milliseconds
+ * @param startMinutes - Start of working hours in minutes since midnight
+ * @param endMinutes - End of working hours in minutes since midnight (inclusive)
+ * @param out - Receives 1 where the time is within working hours, else 0
+ */
+export function workingHoursKernel(
+  localTimes: Float64Array,
+  startMinutes: number,
+  endMinutes: number,
+  out: Uint8Array
+): void {
+  // Working hours measured forward from the start, modulo one day, so hours
+  // that span midnight need no separate branch
+  const span = (endMinutes - startMinutes + 1440) % 1440;
+
+  for (let i = 0; i < localTimes.length; i++) {
+    // Floor-mod so local times before the epoch still land in [0, 1440)
+    const minutes = Math.floor(localTimes[i]! / MINUTE_MS) % 1440;
+    const minuteOfDay = (minutes + 1440) % 1440;
+    out[i] = Number((minuteOfDay - startMinutes + 1440) % 1440 <= span);
+  }
+}
+
+/**
+ * Flag local times that fall on a working day
+ * @param localTimes - Local wall-clock times as epoch milliseconds
+ * @param workingDayMask - Bit `d` set when day `d` (0=Sunday) is a working day
+ * @param out - Receives 1 where the time falls on a working day, else 0
+ */
+export function workingDayKernel(
+  localTimes: Float64Array,
+  workingDayMask: number,
+  out: Uint8Array
+): void {
+  for (let i = 0; i < localTimes.length; i++) {
+    // The epoch (1970-01-01) was a Thursday, day 4 with 0=Sunday; floor-mod
+    // so days before the epoch still map into 0..6
+    const days = Math.floor(localTimes[i]! / DAY_MS);
+    const dayOfWeek = (((days + 4) % 7) + 7) % 7;
+    out[i] = (workingDayMask >> dayOfWeek) & 1;
+  }
+}
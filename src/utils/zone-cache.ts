@@ -0,0 +1,130 @@
+/**
+ * Per-timezone cache of Intl.DateTimeFormat instances
+ *
+ * Constructing an Intl.DateTimeFormat is far more expensive than formatting
+ * with one, so hot paths share a single instance per timezone. Entries are
+ * keyed by the identifier as passed, and the platform accepts case variants
+ * of the same zone, so each cache is a small LRU rather than growing with
+ * every distinct caller string.
+ */
+
+/**
+ * Upper bound on timezones remembered by each per-timezone cache
+ */
+export const MAX_CACHED_ZONES = 64;
+
+const partsFormatters = new Map<string, Intl.DateTimeFormat>();
+const zoneNameFormatters = new Map<string, Intl.DateTimeFormat>();
+
+/**
+ * Resets for caches derived from the platform timezone database, registered
+ * by the modules that own them so this module stays free of imports
+ */
+const dependentCacheResets = new Set<() => void>();
+
+/**
+ * Get the shared formatter for numeric local date/time parts in a timezone
+ * @param timezone - IANA timezone identifier
+ * @returns Cached Intl.DateTimeFormat producing year, month, day, hour, minute and second parts
+ * @throws RangeError if the timezone is not available on the platform
+ */
+export function getPartsFormatter(timezone: string): Intl.DateTimeFormat {
+  let formatter = getRecent(partsFormatters, timezone);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat("en-CA", {
+      timeZone: timezone,
+      year: "numeric",
+      month: "2-digit",
+      day: "2-digit",
+      hour: "2-digit",
+      minute: "2-digit",
+      second: "2-digit",
+      // h23 guarantees midnight is reported as "00" rather than "24"
+      hourCycle: "h23",
+    });
+    setRecent(partsFormatters, timezone, formatter);
+  }
+  return formatter;
+}
+
+/**
+ * Get the shared formatter for the short timezone name in a timezone
+ * @param timezone - IANA timezone identifier
+ * @returns Cached Intl.DateTimeFormat producing a timeZoneName part
+ * @throws RangeError if the timezone is not available on the platform
+ */
+export function getZoneNameFormatter(timezone: string): Intl.DateTimeFormat {
+  let formatter = getRecent(zoneNameFormatters, timezone);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat("en", {
+      timeZone: timezone,
+      timeZoneName: "short",
+    });
+    setRecent(zoneNameFormatters, timezone, formatter);
+  }
+  return formatter;
+}
+
+/**
+ * Register a reset to run whenever the zone cache is cleared
+ * @param reset - Clears a cache derived from the platform timezone database
+ * @returns Function that unregisters the reset
+ */
+export function onZoneCacheClear(reset: () => void): () => void {
+  dependentCacheResets.add(reset);
+  return () => {
+    dependentCacheResets.delete(reset);
+  };
+}
+
+/**
+ * Clear all cached formatters and every cache derived from them
+ *
+ * Drops the formatters along with the transition tables, platform timezone
+ * checks and DST transition results built on top of them. Useful after the
+ * platform timezone database has been updated at runtime.
+ */
+export function clearZoneCache(): void {
+  partsFormatters.clear();
+  zoneNameFormatters.clear();
+
+  for (const reset of dependentCacheResets) {
+    reset();
+  }
+}
+
+/**
+ * Look up a formatter and mark it as the most recently used
+ * @param cache - Formatter cache in least- to most-recently-used order
+ * @param timezone - Timezone identifier as passed by the caller
+ * @returns The cached formatter, or undefined on a miss
+ */
+function getRecent(
+  cache: Map<string, Intl.DateTimeFormat>,
+  timezone: string
+): Intl.DateTimeFormat | undefined {
+  const formatter = cache.get(timezone);
+  if (formatter) {
+    // Maps iterate in insertion order, so re-inserting moves it to the back
+    cache.delete(timezone);
+    cache.set(timezone, formatter);
+  }
+  return formatter;
+}
+
+/**
+ * Cache a formatter, evicting the least recently used one when full
+ * @param cache - Formatter cache in least- to most-recently-used order
+ * @param timezone - Timezone identifier as passed by the caller
+ * @param formatter - The formatter to cache
+ */
+function setRecent(
+  cache: Map<string, Intl.DateTimeFormat>,
+  timezone: string,
+  formatter: Intl.DateTimeFormat
+): void {
+  if (cache.size >= MAX_CACHED_ZONES) {
+    cache.delete(cache.keys().next().value!);
+  }
+  cache.set(timezone, formatter);
+}
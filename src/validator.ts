@@ -5,6 +5,32 @@
 import type { TimeParts } from "./types.js";
 import { getDaysInMonth } from "./utils/date-utils.js";
 
+/**
+ * Minutes since midnight for each HH:MM string parsed so far; only valid
+ * strings are stored, so the cache holds at most 1440 entries
+ */
+const parsedTimeStrings = new Map<string, number>();
+
+/**
+ * Supported date range (1970-2100) as UTC epoch milliseconds, end exclusive
+ */
+const MIN_SUPPORTED_TIME = Date.UTC(1970, 0, 1);
+const MAX_SUPPORTED_TIME = Date.UTC(2101, 0, 1);
+
+/**
+ * Allowed ranges for the clock fields of TimeParts, in validation order
+ */
+const CLOCK_PART_RANGES = [
+  ["hour", 0, 23],
+  ["minute", 0, 59],
+  ["second", 0, 59],
+] as const;
+
+/**
+ * Matches any string containing at least one non-whitespace character
+ */
+const NON_WHITESPACE = /\S/;
+
 /**
  * Validate a Date object
  * @param date - Date to validate
@@ -15,13 +41,15 @@ export function validateDate(date: Date): void {
     throw new Error("Invalid input: expected Date object");
   }
 
-  if (isNaN(date.getTime())) {
+  // Number.isNaN skips the argument coercion done by the global isNaN
+  const time = date.getTime();
+  if (Number.isNaN(time)) {
     throw new Error("Invalid date: date is NaN");
   }
 
-  // Check if date is within reasonable range (1970-2100)
-  const year = date.getFullYear();
-  if (year < 1970 || year > 2100) {
+  // Check if date is within reasonable range (1970-2100), comparing epoch
+  // milliseconds directly instead of deriving a calendar year
+  if (time < MIN_SUPPORTED_TIME || time >= MAX_SUPPORTED_TIME) {
     throw new Error(
       `Date outside supported range: ${date.toISOString()}. Supported range: 1970-2100`
     );
@@ -40,6 +68,32 @@ export function validateTimeParts(parts: TimeParts): void {
 
   const { year, month, day, hour, minute, second } = parts;
 
+  // Fast path for the common all-valid case: `(x | 0) === x` holds only for
+  // int32 integers, and anything rejected here falls through to the detailed
+  // checks below, which produce the error message
+  if (
+    (year | 0) === year &&
+    (month | 0) === month &&
+    (day | 0) === day &&
+    (hour | 0) === hour &&
+    (minute | 0) === minute &&
+    (second | 0) === second &&
+    year >= 1970 &&
+    year <= 2100 &&
+    month >= 1 &&
+    month <= 12 &&
+    day >= 1 &&
+    (day <= 28 || day <= getDaysInMonth(year, month)) &&
+    hour >= 0 &&
+    hour <= 23 &&
+    minute >= 0 &&
+    minute <= 59 &&
+    second >= 0 &&
+    second <= 59
+  ) {
+    return;
+  }
+
   // Validate types
   if (
     !Number.isInteger(year) ||
@@ -72,22 +126,13 @@ export function validateTimeParts(parts: TimeParts): void {
     );
   }
 
-  if (hour < 0 || hour > 23) {
-    throw new Error(
-      `Invalid time parts: hour ${hour} must be between 0 and 23`
-    );
-  }
-
-  if (minute < 0 || minute > 59) {
-    throw new Error(
-      `Invalid time parts: minute ${minute} must be between 0 and 59`
-    );
-  }
-
-  if (second < 0 || second > 59) {
-    throw new Error(
-      `Invalid time parts: second ${second} must be between 0 and 59`
-    );
+  for (const [field, min, max] of CLOCK_PART_RANGES) {
+    const value = parts[field];
+    if (value < min || value > max) {
+      throw new Error(
+        `Invalid time parts: ${field} ${value} must be between ${min} and ${max}`
+      );
+    }
   }
 }
 
@@ -97,7 +142,9 @@ export function validateTimeParts(parts: TimeParts): void {
  * @throws Error if the timezone is invalid
  */
 export function validateTimezone(timezone: string): void {
-  if (typeof timezone !== "string" || timezone.trim() === "") {
+  // A single non-whitespace search rather than allocating a trimmed copy;
+  // \s matches exactly the characters trim() removes
+  if (typeof timezone !== "string" || !NON_WHITESPACE.test(timezone)) {
     throw new Error("Invalid timezone: expected non-empty string");
   }
 }
@@ -108,16 +155,79 @@ export function validateTimezone(timezone: string): void {
  * @throws Error if the time format is invalid
  */
 export function validateTimeString(time: string): void {
+  readTimeString(time);
+}
+
+/**
+ * Parse a working hours time string (HH:MM format) into minutes since midnight
+ * @param time - Time string to parse
+ * @returns Minutes since midnight (0-1439)
+ * @throws Error if the time format is invalid
+ */
+export function parseTimeString(time: string): number {
+  const cached = parsedTimeStrings.get(time);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const minutes = readTimeString(time);
+  parsedTimeStrings.set(time, minutes);
+  return minutes;
+}
+
+/**
+ * Validate a working hours range, returning the parsed bounds
+ * @param start - Start time in HH:MM format
+ * @param end - End time in HH:MM format
+ * @returns Start and end in minutes since midnight
+ * @throws Error if either time format is invalid
+ */
+export function validateWorkingHours(
+  start: string,
+  end: string
+): [number, number] {
+  return [parseTimeString(start), parseTimeString(end)];
+}
+
+/**
+ * Validate and parse an HH:MM time string in a single pass
+ * @param time - Time string to parse
+ * @returns Minutes since midnight (0-1439)
+ * @throws Error if the time format is invalid
+ */
+function readTimeString(time: string): number {
   if (typeof time !== "string") {
     throw new Error("Invalid time: expected string");
   }
 
-  const timeRegex = /^([01][0-9]|2[0-3]):([0-5][0-9])$/;
-  if (!timeRegex.test(time)) {
-    throw new Error(
-      `Invalid time format: ${time}. Expected HH:MM format (e.g., '09:00', '17:30')`
-    );
+  // Fixed-width format, so check character codes in place rather than running
+  // /^([01][0-9]|2[0-3]):([0-5][0-9])$/ and then slicing out the numbers
+  if (time.length === 5 && time.charCodeAt(2) === 58 /* ":" */) {
+    const h1 = time.charCodeAt(0) - 48;
+    const h2 = time.charCodeAt(1) - 48;
+    const m1 = time.charCodeAt(3) - 48;
+    const m2 = time.charCodeAt(4) - 48;
+
+    if (
+      h1 >= 0 &&
+      h1 <= 2 &&
+      h2 >= 0 &&
+      h2 <= 9 &&
+      m1 >= 0 &&
+      m1 <= 5 &&
+      m2 >= 0 &&
+      m2 <= 9
+    ) {
+      const hours = h1 * 10 + h2;
+      if (hours <= 23) {
+        return hours * 60 + m1 * 10 + m2;
+      }
+    }
   }
+
+  throw new Error(
+    `Invalid time format: ${time}. Expected HH:MM format (e.g., '09:00', '17:30')`
+  );
 }
 
 /**
@@ -143,21 +253,40 @@ export function validateYear(year: number): void {
  * @throws Error if the working days are invalid
  */
 export function validateWorkingDays(workingDays: number[]): void {
+  getWorkingDayMask(workingDays);
+}
+
+/**
+ * Validate working days and pack them into a bitmask
+ * @param workingDays - Array of working days (0=Sunday, 1=Monday, etc.)
+ * @returns Bitmask with bit `d` set when day `d` is a working day
+ * @throws Error if the working days are invalid
+ */
+export function getWorkingDayMask(workingDays: readonly number[]): number {
   if (!Array.isArray(workingDays)) {
     throw new Error("Invalid working days: expected array");
   }
 
+  // Single pass: range-check each day and detect duplicates via the mask bits
+  let mask = 0;
+  let hasDuplicates = false;
   for (const day of workingDays) {
     if (!Number.isInteger(day) || day < 0 || day > 6) {
       throw new Error(
         `Invalid working day: ${day}. Expected integers 0-6 (0=Sunday, 1=Monday, etc.)`
       );
     }
+
+    const bit = 1 << day;
+    if (mask & bit) {
+      hasDuplicates = true;
+    }
+    mask |= bit;
   }
 
-  // Check for duplicates
-  const uniqueDays = new Set(workingDays);
-  if (uniqueDays.size !== workingDays.length) {
+  if (hasDuplicates) {
     throw new Error("Invalid working days: contains duplicates");
   }
+
+  return mask;
 }
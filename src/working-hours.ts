@@ -8,11 +8,50 @@ import {
   validateTimezone,
   validatePlatformTimezone,
 } from "./utils/validation.js";
-import { validateWorkingDays } from "./validator.js";
-import { toTimezoneParts } from "./time-converter.js";
+import { getWorkingDayMask, validateWorkingHours } from "./validator.js";
+import { toTimezonePartsUnchecked } from "./time-converter.js";
 import { timezoneDetector } from "./timezone-detector.js";
+import { isHardcodedTimezone } from "./timezone-registry.js";
+import { getDayOfWeek, getTimezoneOffset } from "./utils/date-utils.js";
+import { getOffsetAt, lookupOffsets } from "./utils/transition-table.js";
+import {
+  workingHoursKernel,
+  workingDayKernel,
+} from "./utils/working-hours-kernel.js";
 import { DEFAULT_WORKING_HOURS, DEFAULT_WORKING_DAYS } from "./constants.js";
 
+const MINUTE_MS = 60 * 1000;
+
+/**
+ * Default working hours, read off the shared constant once at load so the
+ * per-call default parameters and identity checks are plain binding reads
+ */
+const { start: DEFAULT_START, end: DEFAULT_END } = DEFAULT_WORKING_HOURS;
+
+/**
+ * Default working hours in minutes since midnight, parsed once at load
+ */
+const DEFAULT_WORKING_MINUTES = validateWorkingHours(
+  DEFAULT_START,
+  DEFAULT_END
+);
+
+/**
+ * Bitmask of the default working days, validated once at load
+ */
+const DEFAULT_WORKING_DAY_MASK = getWorkingDayMask(DEFAULT_WORKING_DAYS);
+
+/**
+ * Validated inWorkingHours hours, keyed by start + end (valid HH:MM strings
+ * are five characters each, so the concatenation is unambiguous)
+ */
+const workingHoursConfigs = new Map<string, readonly [number, number]>();
+
+/**
+ * Upper bound on cached configurations; the cache is reset once exceeded
+ */
+const MAX_WORKING_HOURS_CONFIGS = 1024;
+
 /**
  * Check if a timestamp falls within working hours for a given timezone
  *
@@ -56,53 +95,66 @@ import { DEFAULT_WORKING_HOURS, DEFAULT_WORKING_DAYS } from "./constants.js";
 export function inWorkingHours(
   date: Date,
   timezone?: string,
-  start: string = DEFAULT_WORKING_HOURS.start,
-  end: string = DEFAULT_WORKING_HOURS.end
+  start: string = DEFAULT_START,
+  end: string = DEFAULT_END
 ): boolean {
   validateDate(date);
 
-  // Validate time strings inline (only used here)
-  const validateTimeString = (time: string): void => {
-    if (typeof time !== "string") {
-      throw new Error("Invalid time: expected string");
-    }
-    const timeRegex = /^([01][0-9]|2[0-3]):([0-5][0-9])$/;
-    if (!timeRegex.test(time)) {
-      throw new Error(
-        `Invalid time format: ${time}. Expected HH:MM format (e.g., '09:00', '17:30')`
-      );
-    }
-  };
+  // Validate the hours before resolving the timezone, so invalid hours are
+  // reported first; each distinct (start, end) pair is parsed only once
+  const [startMinutes, endMinutes] = getWorkingHoursConfig(start, end);
+  const effectiveTimezone = resolveTimezone(timezone);
 
-  validateTimeString(start);
-  validateTimeString(end);
+  // Inputs are validated above, so skip toTimezoneParts' second validation pass
+  const localParts = toTimezonePartsUnchecked(date, effectiveTimezone);
 
-  // Use auto-detection if no timezone provided
-  const effectiveTimezone = timezone ?? timezoneDetector.getDetectedTimezone();
-  validateTimezone(effectiveTimezone);
+  // Convert current time to minutes since midnight
+  const currentMinutes = localParts.hour * 60 + localParts.minute;
 
-  validatePlatformTimezone(effectiveTimezone);
+  return isWithinWorkingHours(currentMinutes, startMinutes, endMinutes);
+}
 
-  // Get timezone-local time components
-  const localParts = toTimezoneParts(date, effectiveTimezone);
+/**
+ * Check many timestamps against working hours in a single timezone
+ *
+ * Batch counterpart of inWorkingHours. Inputs are validated once, the UTC
+ * offset of every timestamp is resolved in one pass (from the precomputed
+ * transition table for registry timezones), and the comparison is done on
+ * plain local epoch arithmetic.
+ *
+ * @param dates - The dates to check (each must be a valid Date object)
+ * @param timezone - IANA timezone identifier (optional, auto-detects if omitted)
+ * @param start - Start time in HH:MM format (defaults to '09:00')
+ * @param end - End time in HH:MM format (defaults to '17:30')
+ * @returns Working-hours flags, index-aligned with `dates`
+ *
+ * @throws {Error} If any date is invalid (NaN) or outside supported range (1970-2100)
+ * @throws {Error} If timezone is not supported or unavailable on platform
+ * @throws {Error} If time format is invalid (must be HH:MM format, e.g., '09:00')
+ * @throws {TimezoneDetectionError} If timezone detection fails and fallback is invalid
+ *
+ * @example
+ * ```typescript
+ * const dates = [
+ *   new Date('2024-07-15T07:00:00Z'),
+ *   new Date('2024-07-15T13:00:00Z'),
+ * ];
+ * console.log(inWorkingHoursBatch(dates, 'Europe/London')); // [false, true]
+ * ```
+ */
+export function inWorkingHoursBatch(
+  dates: readonly Date[],
+  timezone?: string,
+  start: string = DEFAULT_START,
+  end: string = DEFAULT_END
+): boolean[] {
+  const [startMinutes, endMinutes] = parseWorkingHours(start, end);
 
-  // Parse start and end times
-  const [startHour, startMinute] = start.split(":").map(Number);
-  const [endHour, endMinute] = end.split(":").map(Number);
+  const localTimes = getLocalTimes(dates, timezone);
+  const flags = new Uint8Array(localTimes.length);
+  workingHoursKernel(localTimes, startMinutes, endMinutes, flags);
 
-  // Convert current time to minutes since midnight
-  const currentMinutes = localParts.hour * 60 + localParts.minute;
-  const startMinutes = startHour! * 60 + startMinute!;
-  const endMinutes = endHour! * 60 + endMinute!;
-
-  // Check if current time is within working hours
-  if (startMinutes <= endMinutes) {
-    // Normal case: start and end are on the same day
-    return currentMinutes >= startMinutes && currentMinutes <= endMinutes;
-  } else {
-    // Edge case: working hours span midnight (e.g., 22:00 to 06:00)
-    return currentMinutes >= startMinutes || currentMinutes <= endMinutes;
-  }
+  return Array.from(flags, Boolean);
 }
 
 /**
@@ -115,10 +167,22 @@ export function inWorkingHours(
  */
 export function inWorkingHoursLondon(
   date: Date,
-  start: string = DEFAULT_WORKING_HOURS.start,
-  end: string = DEFAULT_WORKING_HOURS.end
+  start: string = DEFAULT_START,
+  end: string = DEFAULT_END
 ): boolean {
-  return inWorkingHours(date, "Europe/London", start, end);
+  validateDate(date);
+
+  const [startMinutes, endMinutes] = parseWorkingHours(start, end);
+
+  resolveTimezone("Europe/London");
+
+  // London is a registry timezone, so read its offset straight from the
+  // precomputed transition table instead of formatting local parts
+  const offset = getOffsetAt(date.getTime(), "Europe/London");
+  const minutes = Math.floor(date.getTime() / MINUTE_MS + offset) % 1440;
+  const currentMinutes = (minutes + 1440) % 1440;
+
+  return isWithinWorkingHours(currentMinutes, startMinutes, endMinutes);
 }
 
 /**
@@ -136,28 +200,247 @@ export function inWorkingHoursLondon(
 export function isWorkingDay(
   date: Date,
   timezone?: string,
-  workingDays: WorkingDays = [...DEFAULT_WORKING_DAYS]
+  workingDays?: WorkingDays
+): boolean {
+  validateDate(date);
+  const workingDayMask =
+    workingDays === undefined
+      ? DEFAULT_WORKING_DAY_MASK
+      : getWorkingDayMask(workingDays);
+
+  const effectiveTimezone = resolveTimezone(timezone);
+
+  // Inputs are validated above, so skip toTimezoneParts' second validation pass
+  const localParts = toTimezonePartsUnchecked(date, effectiveTimezone);
+
+  // Derive the day of week from the local calendar date (0=Sunday, 1=Monday, etc.)
+  const dayOfWeek = getDayOfWeek(
+    localParts.year,
+    localParts.month,
+    localParts.day
+  );
+
+  return ((workingDayMask >> dayOfWeek) & 1) === 1;
+}
+
+/**
+ * Check if a timestamp falls within working hours on a working day
+ *
+ * Equivalent to `isWorkingDay(...) && inWorkingHours(...)`, but validates the
+ * inputs and converts to local time only once. Prefer this over calling both
+ * functions when checking whether someone is at work.
+ *
+ * When no timezone is provided, automatically detects the user's timezone.
+ *
+ * @param date - The date to check (must be a valid Date object)
+ * @param timezone - IANA timezone identifier (optional, auto-detects if omitted)
+ * @param start - Start time in HH:MM format (defaults to '09:00')
+ * @param end - End time in HH:MM format (defaults to '17:30')
+ * @param workingDays - Array of working days (0=Sunday, 1=Monday, etc.) (defaults to Monday-Friday)
+ * @returns `true` if the timestamp is within working hours on a working day
+ *
+ * @throws {Error} If date is invalid (NaN) or outside supported range (1970-2100)
+ * @throws {Error} If timezone is not supported or unavailable on platform
+ * @throws {Error} If time format is invalid (must be HH:MM format, e.g., '09:00')
+ * @throws {Error} If working days are invalid
+ * @throws {TimezoneDetectionError} If timezone detection fails and fallback is invalid
+ *
+ * @example
+ * ```typescript
+ * const mondayAfternoon = new Date('2024-07-15T13:00:00Z');   // Monday 14:00 BST
+ * const saturdayAfternoon = new Date('2024-07-20T13:00:00Z'); // Saturday 14:00 BST
+ *
+ * console.log(isWorkingMoment(mondayAfternoon, 'Europe/London'));   // true
+ * console.log(isWorkingMoment(saturdayAfternoon, 'Europe/London')); // false
+ * ```
+ */
+export function isWorkingMoment(
+  date: Date,
+  timezone?: string,
+  start: string = DEFAULT_START,
+  end: string = DEFAULT_END,
+  workingDays?: WorkingDays
 ): boolean {
   validateDate(date);
-  validateWorkingDays(workingDays);
 
   // Use auto-detection if no timezone provided
   const effectiveTimezone = timezone ?? timezoneDetector.getDetectedTimezone();
-  validateTimezone(effectiveTimezone);
 
-  validatePlatformTimezone(effectiveTimezone);
+  const [startMinutes, endMinutes] = getWorkingHoursConfig(
+    effectiveTimezone,
+    start,
+    end
+  );
+  const workingDayMask =
+    workingDays === undefined
+      ? DEFAULT_WORKING_DAY_MASK
+      : getWorkingDayMask(workingDays);
 
-  // Get timezone-local date to determine the correct day of week
-  const localParts = toTimezoneParts(date, effectiveTimezone);
+  // One local time conversion serves both the day and the hours check
+  const localParts = toTimezonePartsUnchecked(date, effectiveTimezone);
 
-  // Create a date in the local timezone to get the correct day of week
-  // Note: We use the local parts to construct a date that represents the local date
-  const localDate = new Date(
+  const dayOfWeek = getDayOfWeek(
     localParts.year,
-    localParts.month - 1,
+    localParts.month,
     localParts.day
   );
-  const dayOfWeek = localDate.getDay(); // 0=Sunday, 1=Monday, etc.
+  if (((workingDayMask >> dayOfWeek) & 1) === 0) {
+    return false;
+  }
+
+  const currentMinutes = localParts.hour * 60 + localParts.minute;
+  return isWithinWorkingHours(currentMinutes, startMinutes, endMinutes);
+}
+
+/**
+ * Check many dates for working days in a single timezone
+ *
+ * Batch counterpart of isWorkingDay. Inputs are validated once and the local
+ * day of week is derived from the local epoch day rather than a Date per item.
+ *
+ * @param dates - The dates to check
+ * @param timezone - The timezone identifier (optional, auto-detects if omitted)
+ * @param workingDays - Array of working days (0=Sunday, 1=Monday, etc.) (defaults to Monday-Friday)
+ * @returns Working-day flags, index-aligned with `dates`
+ * @throws Error if inputs are invalid
+ * @throws {TimezoneDetectionError} If timezone detection fails and fallback is invalid
+ */
+export function isWorkingDayBatch(
+  dates: readonly Date[],
+  timezone?: string,
+  workingDays?: WorkingDays
+): boolean[] {
+  const workingDayMask =
+    workingDays === undefined
+      ? DEFAULT_WORKING_DAY_MASK
+      : getWorkingDayMask(workingDays);
+
+  const localTimes = getLocalTimes(dates, timezone);
+  const flags = new Uint8Array(localTimes.length);
+  workingDayKernel(localTimes, workingDayMask, flags);
+
+  return Array.from(flags, Boolean);
+}
+
+/**
+ * Resolve the effective timezone and validate it
+ * @param timezone - IANA timezone identifier (optional, auto-detects if omitted)
+ * @returns The validated timezone identifier
+ * @throws Error if the timezone is invalid or unavailable on the platform
+ * @throws {TimezoneDetectionError} If timezone detection fails and fallback is invalid
+ */
+function resolveTimezone(timezone: string | undefined): string {
+  // Use auto-detection if no timezone provided
+  const effectiveTimezone = timezone ?? timezoneDetector.getDetectedTimezone();
+
+  validateTimezone(effectiveTimezone);
+  validatePlatformTimezone(effectiveTimezone);
+
+  return effectiveTimezone;
+}
+
+/**
+ * Get validated working hours, validating each distinct pair on first use
+ * @param start - Start time in HH:MM format
+ * @param end - End time in HH:MM format
+ * @returns Start and end in minutes since midnight
+ * @throws Error if either time format is invalid
+ */
+function getWorkingHoursConfig(
+  start: string,
+  end: string
+): readonly [number, number] {
+  // Non-strings must not reach the cache, where they could stringify to a key
+  if (typeof start !== "string" || typeof end !== "string") {
+    return validateWorkingHours(start, end);
+  }
+
+  const hoursKey = start + end;
+  const cached = workingHoursConfigs.get(hoursKey);
+  if (cached) {
+    return cached;
+  }
+
+  const config = parseWorkingHours(start, end);
+
+  if (workingHoursConfigs.size >= MAX_WORKING_HOURS_CONFIGS) {
+    workingHoursConfigs.clear();
+  }
+  workingHoursConfigs.set(hoursKey, config);
+
+  return config;
+}
+
+/**
+ * Validate and parse working hours, reusing the pre-parsed defaults
+ * @param start - Start time in HH:MM format
+ * @param end - End time in HH:MM format
+ * @returns Start and end in minutes since midnight
+ * @throws Error if either time format is invalid
+ */
+function parseWorkingHours(
+  start: string,
+  end: string
+): readonly [number, number] {
+  if (start === DEFAULT_START && end === DEFAULT_END) {
+    return DEFAULT_WORKING_MINUTES;
+  }
+
+  return validateWorkingHours(start, end);
+}
+
+/**
+ * Check whether a time of day falls within working hours (inclusive)
+ * @param currentMinutes - Time of day in minutes since midnight
+ * @param startMinutes - Start of working hours in minutes since midnight
+ * @param endMinutes - End of working hours in minutes since midnight
+ * @returns True if the time is within working hours
+ */
+function isWithinWorkingHours(
+  currentMinutes: number,
+  startMinutes: number,
+  endMinutes: number
+): boolean {
+  // Measure both times forward from the start, modulo one day, so hours that
+  // span midnight (e.g., 22:00 to 06:00) need no separate branch
+  return (
+    (currentMinutes - startMinutes + 1440) % 1440 <=
+    (endMinutes - startMinutes + 1440) % 1440
+  );
+}
+
+/**
+ * Validate a batch of dates and shift each to its local wall-clock time
+ * @param dates - The dates to convert (each must be a valid Date object)
+ * @param timezone - The timezone identifier (optional, auto-detects if omitted)
+ * @returns Local wall-clock times read as UTC epoch milliseconds
+ * @throws Error if any date or the timezone is invalid
+ */
+function getLocalTimes(
+  dates: readonly Date[],
+  timezone: string | undefined
+): Float64Array {
+  const effectiveTimezone = resolveTimezone(timezone);
+
+  const times = new Float64Array(dates.length);
+  for (let i = 0; i < dates.length; i++) {
+    const date = dates[i]!;
+    validateDate(date);
+    times[i] = date.getTime();
+  }
 
-  return workingDays.includes(dayOfWeek);
+  // Registry timezones resolve all offsets from the precomputed table
+  if (isHardcodedTimezone(effectiveTimezone)) {
+    const offsets = lookupOffsets(times, effectiveTimezone);
+    for (let i = 0; i < times.length; i++) {
+      times[i] = times[i]! + offsets[i]! * MINUTE_MS;
+    }
+    return times;
+  }
+
+  for (let i = 0; i < times.length; i++) {
+    times[i] =
+      times[i]! + getTimezoneOffset(dates[i]!, effectiveTimezone) * MINUTE_MS;
+  }
+  return times;
 }